@@ -10,22 +10,50 @@ with data in ways you can't with excel!
 import logging
 import os
 import sys
+import io
+import re
+import csv
+import gzip
+import bz2
+import lzma
+import zipfile
+import contextlib
+import shutil
+import glob
+import atexit
+import tempfile
+import hashlib
+import threading
+import time
+import weakref
+import json
+import base64
+import multiprocessing
 from pathlib import Path
 from datetime import datetime
 import dateutil
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, CancelledError, TimeoutError
+import numpy as np
 import pandas as pd
+try:
+    import zstandard
+except ImportError:
+    # .zst files can only be read with zstandard installed
+    zstandard = None
 import numexpr as ne
 import math
 import hjson
 import plotly.express as px
 import plotly.graph_objects as go
 import plotly.offline
+import plotly.io.json
 from plotly.subplots import make_subplots
-from PyQt5.QtWidgets import QMainWindow, QCheckBox, QAction, QWidget, QGroupBox, QLabel, QSplitter, QHBoxLayout, QGridLayout, QLineEdit, QListWidget, QTabWidget, QComboBox, QSpinBox, QPushButton, QInputDialog, QApplication, QMessageBox, QFileDialog, QDialog, QListWidgetItem, QDesktopWidget, QAbstractItemView
+from PyQt5.QtWidgets import QMainWindow, QCheckBox, QAction, QWidget, QGroupBox, QLabel, QSplitter, QHBoxLayout, QGridLayout, QLineEdit, QListWidget, QTabWidget, QComboBox, QSpinBox, QPushButton, QInputDialog, QApplication, QMessageBox, QFileDialog, QDialog, QListWidgetItem, QDesktopWidget, QAbstractItemView, QProgressBar
 from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import Qt, QUrl, QFileInfo, pyqtSlot
+from PyQt5.QtCore import Qt, QUrl, QFileInfo, QFileSystemWatcher, QObject, QThread, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtWebEngineWidgets import QWebEngineView
+from PyQt5.QtWebChannel import QWebChannel
 
 if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
     #print('running in a PyInstaller bundle')
@@ -48,6 +76,1787 @@ else:
     EXPORT_ICON = "Icons" + os.path.sep + "export_html.ico"
     DOC_PATH = "Documents"
 
+# delimiter options for file import methods
+DELIMITERS = {"Comma":",", "Semicolon":";", "Tab":"\t"}
+
+# compressed file extensions, these files are decompressed as they are parsed
+COMPRESSIONS = {".gz":"gzip", ".bz2":"bz2", ".xz":"xz", ".zst":"zstd", ".zip":"zip"}
+
+# parsers for text files, the C parser is the fallback for everything the others can't handle
+PARSERS = ["C", "PyArrow", "NumPy"]
+# typed array dtypes plotly.js can decode
+TYPED_ARRAYS = ["f4", "f8", "i1", "i2", "i4", "u1", "u2", "u4"]
+# how scatter and line traces are drawn, auto picks webgl for large traces
+RENDER_MODES = ["Auto", "SVG", "WebGL"]
+# how pair plots are drawn, auto picks density grids for large data
+DENSITY_MODES = ["Auto", "Points", "Density"]
+
+# epoch units for file import methods, auto picks the unit from the size of the values
+EPOCH_UNITS = {"Auto":None, "Seconds":"s", "Milliseconds":"ms", "Microseconds":"us", "Nanoseconds":"ns"}
+# row index type of sparse columns, taken from the public sp_index so sparse columns can be built without a dense pass
+SPARSE_INDEX = type(pd.arrays.SparseArray([np.nan]).sp_index)
+
+
+def header_rows(method):
+    # create list of rows between header and data start
+    if method["Data_Row"] - method["Header_Row"] <= 1:
+        return method["Header_Row"] - 1
+    else:
+        return list(range(method["Header_Row"] - 1, method["Data_Row"] - 2))
+
+
+class Load_Cancelled(Exception):
+    # raised inside the file loaders when the user cancels a load
+    pass
+
+
+class Progress_File(io.BufferedReader):
+    # binary file handle that reports the bytes read and stops the parse if the load is cancelled
+    def __init__(self, file, progress=None, cancel=None):
+        io.BufferedReader.__init__(self, io.FileIO(file, "rb"))
+        self.file = file
+        self.progress = progress
+        self.cancel = cancel
+
+    def report(self, n):
+        if self.cancel is not None and self.cancel.is_set():
+            raise Load_Cancelled()
+        if self.progress is not None and n:
+            self.progress(self.file, n, False)
+
+    def read(self, size=-1):
+        data = io.BufferedReader.read(self, size)
+        self.report(len(data))
+        return data
+
+    def read1(self, size=-1):
+        data = io.BufferedReader.read1(self, size)
+        self.report(len(data))
+        return data
+
+    def readinto(self, b):
+        n = io.BufferedReader.readinto(self, b)
+        self.report(n)
+        return n
+
+    def readinto1(self, b):
+        n = io.BufferedReader.readinto1(self, b)
+        self.report(n)
+        return n
+
+
+def file_compression(file):
+    # compression of a data file from its extension, None for plain files
+    extension = os.path.splitext(file)[1].lower()
+    return COMPRESSIONS.get(extension, None)
+
+
+@contextlib.contextmanager
+def open_data_file(file, progress=None, cancel=None):
+    # binary stream of a data file, compressed files are decompressed as they are read
+    # progress counts compressed bytes since the progress bar goes by file size
+    compression = file_compression(file)
+    with Progress_File(file, progress, cancel) as raw:
+        if compression is None:
+            yield raw
+        elif compression == "gzip":
+            with gzip.GzipFile(fileobj=raw) as f:
+                yield f
+        elif compression == "bz2":
+            with bz2.BZ2File(raw) as f:
+                yield f
+        elif compression == "xz":
+            with lzma.LZMAFile(raw) as f:
+                yield f
+        elif compression == "zstd":
+            if zstandard is None:
+                raise ValueError("The zstandard package is needed to read %s" % file)
+            with zstandard.ZstdDecompressor().stream_reader(raw, closefd=False) as f:
+                yield f
+        else:
+            # the first file in the archive is the data file
+            with zipfile.ZipFile(raw) as archive:
+                members = [info for info in archive.infolist() if not info.is_dir()]
+                if not members:
+                    raise ValueError("%s is empty" % file)
+                with archive.open(members[0]) as f:
+                    yield f
+
+
+def parse_datetimes(values, method, fixed_only=False):
+    # convert a whole column to datetime64 at once
+    # with fixed_only text is only parsed with the fixed formats, for columns nobody said were times
+    if method["Datetime_Format"].lower() == "iso":
+        if values.dtype.kind == "M":
+            return values
+        # numbers would be read as nanoseconds since 1970
+        if values.dtype.kind in "biufc":
+            raise ValueError("%s holds numbers, not ISO datetimes" % values.name)
+        # try the fixed format paths first, then fall back to general parsing
+        formats = ["ISO8601"]
+        if method.get("Datetime_Pattern", ""):
+            formats.insert(0, method["Datetime_Pattern"])
+        for fmt in formats:
+            try:
+                return pd.to_datetime(values, format=fmt)
+            except (ValueError, TypeError):
+                pass
+        if fixed_only:
+            raise ValueError("%s doesn't match the datetime format" % values.name)
+        try:
+            return pd.to_datetime(values)
+        except (ValueError, TypeError):
+            # last resort, parse element by element
+            return values.map(dateutil.parser.isoparse)
+    else: # unix epoch
+        values = pd.to_numeric(values, errors="raise")
+        unit = EPOCH_UNITS[method.get("Epoch_Unit", "Auto")]
+        if unit is None:
+            magnitude = np.nanmax(np.abs(values.to_numpy(dtype=float))) if len(values) > 0 else 0
+            if magnitude < 1e11:
+                unit = "s"
+            elif magnitude < 1e14:
+                unit = "ms"
+            elif magnitude < 1e17:
+                unit = "us"
+            else:
+                unit = "ns"
+        return pd.to_datetime(values, unit=unit)
+
+
+def convert_datetime_columns(data, method):
+    # convert the datetime columns listed in the file import method, defaulting to the first column
+    columns = method.get("Datetime_Columns", [])
+    declared = len(columns) > 0
+    # binary records are all numbers, the first field is only a time when the method says it's unix epoch
+    if not declared and method.get("File_Type", "").lower() == "binary" and method["Datetime_Format"].lower() == "iso":
+        return data
+    if not declared and len(data.columns) > 0:
+        # projected loads name the first column of the file since it may not be parsed
+        columns = [method.get("Default_Datetime_Column", data.columns[0])]
+        if columns[0] not in data.columns:
+            return data
+    for col in columns:
+        if col not in data.columns:
+            logging.warning("Datetime column %s not found in data" % col)
+            continue
+        if data[col].dtype.kind == "M":
+            continue
+        try:
+            data[col] = parse_datetimes(data[col], method, fixed_only=not declared)
+        except Exception:
+            # only complain about columns the user asked for
+            if declared:
+                logging.exception("Exception thrown while converting %s to datetime!" % col)
+    return data
+
+
+def time_window(method):
+    # start and end of the time window of a file import method, None for an open end
+    window = method.get("Time_Window", None) or [None, None]
+    return [pd.Timestamp(t) if t else None for t in window]
+
+
+def window_time_column(columns, method):
+    # the column the time window is applied to
+    columns = list(columns)
+    if method.get("Datetime_Columns", []):
+        return method["Datetime_Columns"][0]
+    return method.get("Default_Datetime_Column", columns[0] if columns else None)
+
+
+def window_times(data, method):
+    # drop the rows outside the time window, sorted times are sliced so no rows are copied
+    start, end = time_window(method)
+    if start is None and end is None:
+        return data
+    col = window_time_column(data.columns, method)
+    if col not in data.columns or data[col].dtype.kind != "M":
+        logging.warning("Time window not applied, %s is not a datetime column" % col)
+        return data
+    times = data[col]
+    if times.is_monotonic_increasing:
+        i = 0 if start is None else times.searchsorted(start, side="left")
+        j = len(times) if end is None else times.searchsorted(end, side="right")
+        if i == 0 and j == len(times):
+            return data
+        rows = slice(i, j)
+    else:
+        rows = np.ones(len(times), dtype=bool)
+        if start is not None:
+            rows &= (times >= start).to_numpy()
+        if end is not None:
+            rows &= (times <= end).to_numpy()
+    # built column by column so the result is its own frame rather than a slice of the parsed data
+    return pd.DataFrame({name: data[name].iloc[rows] for name in data.columns}, columns=data.columns, copy=False)
+
+
+def window_ended(data, method):
+    # true once sorted data has gone past the end of the time window, so the rest of a file can be skipped
+    end = time_window(method)[1]
+    col = window_time_column(data.columns, method)
+    if end is None or col not in data.columns or data[col].dtype.kind != "M" or len(data) == 0:
+        return False
+    return data[col].is_monotonic_increasing and data[col].iloc[0] > end
+
+
+def row_window_args(method):
+    # skiprows and nrows arguments for the row window of a file import method
+    # rows are counted from the first data row of each file, a last row of 0 reads to the end
+    first, last = method.get("Row_Window", None) or [1, 0]
+    args = {}
+    if first > 1:
+        args["skiprows"] = range(method["Data_Row"] - 1, method["Data_Row"] + first - 2)
+    if last > 0:
+        args["nrows"] = max(last - first + 1, 0)
+    return args
+
+
+def filename_time(file):
+    # timestamp in a file name, like log_20240101_130000.csv
+    match = re.search(r"(\d{4})-?(\d{2})-?(\d{2})[T_ -]?(\d{2})[-:.]?(\d{2})[-:.]?(\d{2})", os.path.basename(file))
+    if match is None:
+        return None
+    try:
+        return pd.Timestamp(*[int(n) for n in match.groups()])
+    except ValueError:
+        return None
+
+
+def outside_time_window(file, method):
+    # check if a text file is entirely outside the time window from its name, first and last rows
+    start, end = time_window(method)
+    if start is None and end is None:
+        return False
+    if end is not None:
+        file_start = filename_time(file)
+        if file_start is not None and file_start > end:
+            return True
+    # the tail of a compressed file can't be read without decompressing all of it
+    if method["File_Type"].lower() != "text" or isinstance(header_rows(method), list) or file_compression(file) is not None:
+        return False
+    try:
+        header = read_header(file, method)
+        col = window_time_column(header, method)
+        sep = DELIMITERS[method["Delimiter"]]
+        first = pd.read_csv(file, header=header_rows(method), sep=sep, nrows=1, usecols=[col])
+        # the last complete line is somewhere in the tail of the file
+        with open(file, "rb") as f:
+            f.seek(max(os.path.getsize(file) - 65536, 0))
+            lines = [line for line in f.read().splitlines() if line.strip()]
+        last = pd.read_csv(io.BytesIO(lines[-1]), header=None, names=header, sep=sep, usecols=[col])
+        times = parse_datetimes(pd.concat([first[col], last[col]], ignore_index=True), method)
+    except Exception as e:
+        logging.warning("Can't read the time range of %s (%s), parsing all of it" % (file, e))
+        return False
+    return (end is not None and times.min() > end) or (start is not None and times.max() < start)
+
+
+def profile_variables(profile):
+    # list every channel a plotting profile (.pbprof) references
+    names = [profile["Time Series"]["Time Variable"]]
+    for key, value in profile["Time Series"].items():
+        if key.endswith("Variables"):
+            names.extend(value)
+    for tab in ["X-Y", "3D", "Histogram"]:
+        for key in ["X Variable", "Y Variable", "Z Variable", "Color Variable"]:
+            names.append(profile[tab].get(key, ""))
+    names.extend(profile["Pair Plot"]["Variables"])
+    names.append(profile["Pair Plot"]["Color Variable"])
+
+    # drop empty selections and duplicates, keeping the order
+    variables = []
+    for name in names:
+        if name not in ["", "None"] and name not in variables:
+            variables.append(name)
+    return variables
+
+
+def read_header(file, method):
+    # read only the column names of a file
+    file_type = method["File_Type"].lower()
+    if file_type == "text":
+        with open_data_file(file) as f:
+            data = pd.read_csv(f, header=header_rows(method), sep=DELIMITERS[method["Delimiter"]], skip_blank_lines=False, nrows=0)
+    elif file_type == "spreadsheet":
+        data = pd.read_excel(file, sheet_name=workbook_sheets(file, method)[0], header=header_rows(method), nrows=0)
+    elif file_type == "binary":
+        return list(binary_dtype(method).names)
+    else:
+        raise ValueError("Unknown file type %s" % method["File_Type"])
+    return list(data.columns)
+
+
+def sniff_value(field):
+    # true for fields that look like data rather than a column name
+    field = field.strip()
+    if field == "":
+        return True
+    try:
+        float(field)
+        return True
+    except ValueError:
+        pass
+    try:
+        pd.Timestamp(field)
+        return True
+    except (ValueError, TypeError, OverflowError):
+        return False
+
+
+def sniff_file(file, size=65536):
+    # guess the layout of a data file from its first few kilobytes
+    name = os.path.splitext(file)[0] if file_compression(file) not in (None, "zip") else file
+    extension = os.path.splitext(name)[1].lower()
+    if extension in (".xls", ".xlsx"):
+        return {"File_Type":"Spreadsheet"}
+
+    # binary files are told apart by their bytes, .dat and friends are just as often text
+    with open_data_file(file) as f:
+        sample = f.read(size)
+    control = sum(sample.count(bytes([c])) for c in range(32) if c not in (9, 10, 12, 13))
+    if b"\x00" in sample or control > len(sample) // 10:
+        return {"File_Type":"Binary", "Size":os.path.getsize(file)}
+    lines = sample.decode("utf-8", errors="replace").splitlines()
+    if len(sample) == size:
+        # the last line is probably cut off
+        lines = lines[:-1]
+    filled = [line for line in lines if line.strip() != ""]
+    if not filled:
+        return {"File_Type":"Text"}
+
+    # the delimiter is sniffed from the end of the sample, past any header lines
+    try:
+        delimiter = csv.Sniffer().sniff("\n".join(filled[-50:]), delimiters="".join(DELIMITERS.values())).delimiter
+    except csv.Error:
+        delimiter = max(DELIMITERS.values(), key=filled[-1].count)
+    rows = list(csv.reader(lines, delimiter=delimiter))
+    widths = [len(row) for row in rows[len(rows) // 2:] if row]
+    width = max(set(widths), key=widths.count)
+
+    # data starts at the first row of mostly values where every row after it is full width or blank
+    full = [len(row) == width for row in rows]
+    fits = [len(row) in (0, width) for row in rows]
+    data_start = max(i for i in range(len(rows)) if full[i])
+    for i in range(len(rows)):
+        if full[i] and all(fits[i:]) and sum(sniff_value(field) for field in rows[i]) > width / 2:
+            data_start = i
+            break
+    # the header is the block of full width rows right before the data
+    header_start = data_start
+    while header_start > 0 and full[header_start - 1] and sum(sniff_value(field) for field in rows[header_start - 1]) <= width / 2:
+        header_start -= 1
+    header_start = min(header_start, data_start - 1) if data_start > 0 else 0
+
+    # text times are treated as iso, numbers as unix epoch
+    try:
+        float(rows[data_start][0])
+        datetime_format = "Unix Epoch"
+    except ValueError:
+        datetime_format = "ISO"
+
+    delimiters = {value: key for key, value in DELIMITERS.items()}
+    return {"File_Type":"Text", "Delimiter":delimiters[delimiter], "Header_Row":header_start + 1, "Data_Row":data_start + 1,
+            "Datetime_Format":datetime_format, "Columns":rows[header_start] if header_start < data_start else [], "Width":width}
+
+
+def method_match(method, sniffed):
+    # score how well a file import method fits a sniffed file, higher is better and None means it can't read the file
+    file_type = method.get("File_Type", "").lower()
+    if file_type != sniffed["File_Type"].lower():
+        return None
+    if file_type == "binary":
+        try:
+            itemsize = binary_dtype(method).itemsize
+        except Exception:
+            return None
+        return 1 if (sniffed["Size"] - int(method.get("Header_Length", 0))) % itemsize == 0 else 0
+    if "Delimiter" not in sniffed:
+        return 0
+    matched = method.get("Delimiter", "") == sniffed["Delimiter"]
+    # a single column file reads the same with any delimiter, so the sniffed one is only a guess
+    if not matched and sniffed.get("Width", 2) > 1:
+        return None
+    return matched + sum(method.get(key, None) == sniffed[key] for key in ["Header_Row", "Data_Row", "Datetime_Format"])
+
+
+def binary_dtype(method):
+    # numpy record dtype from a record layout like "Time:f8, Speed:f4, Gear:u1"
+    order = ">" if method.get("Endianness", "Little") == "Big" else "<"
+    fields = []
+    for field in method["Record_Layout"].split(","):
+        name, dtype = field.rsplit(":", 1)
+        fields.append((name.strip(), np.dtype(dtype.strip()).newbyteorder(order)))
+    return np.dtype(fields)
+
+
+def read_binary_file(file, method, progress=None):
+    # memory map a file of fixed size records, pages are only read from disk when a column is used
+    dtype = binary_dtype(method)
+    offset = int(method.get("Header_Length", 0))
+    size = os.path.getsize(file)
+    # a record that is still being written is left off
+    records = max(size - offset, 0) // dtype.itemsize
+    usecols = use_columns(method)
+    names = [name for name in dtype.names if usecols is None or usecols(name)]
+    if records == 0:
+        return pd.DataFrame({name: np.empty(0, dtype[name].newbyteorder("=")) for name in names})
+    values = np.memmap(file, dtype=dtype, mode="r", offset=offset, shape=(records,))
+    first, last = method.get("Row_Window", None) or [1, 0]
+    values = values[first-1:last if last > 0 else records]
+    columns = {}
+    for name in names:
+        column = values[name]
+        # pandas only takes native byte order, swapped columns have to be copied
+        if not column.dtype.isnative:
+            column = column.astype(column.dtype.newbyteorder("="))
+        columns[name] = column
+    if progress is not None:
+        progress(file, size, False)
+    return pd.DataFrame(columns, copy=False)
+
+
+def project_method(method, header, columns):
+    # copy of a file import method that only parses the given columns (plus the datetime columns)
+    method = dict(method)
+    datetime_columns = method.get("Datetime_Columns", [])
+    if not datetime_columns and len(header) > 0:
+        method["Default_Datetime_Column"] = header[0]
+        datetime_columns = [header[0]]
+    method["Use_Columns"] = [col for col in header if col in columns or col in datetime_columns]
+    return method
+
+
+def use_columns(method):
+    # usecols argument for the parsers, a callable so files missing a column still load
+    columns = method.get("Use_Columns", None)
+    if columns is None:
+        return None
+    columns = set(columns)
+    return lambda col: col in columns
+
+
+def read_text_file(file, method, progress=None, cancel=None):
+    # parse a text file with the parser picked in the file import method
+    parser = method.get("Parser", "C")
+    if parser not in PARSERS:
+        logging.warning("Unknown parser %s, using the C parser" % parser)
+        parser = "C"
+    windowed = method.get("Time_Window", None) or method.get("Row_Window", None)
+    if parser != "C" and (isinstance(header_rows(method), list) or windowed):
+        # multi row headers and windows are only understood by the C parser
+        parser = "C"
+
+    start = time.perf_counter()
+    data = None
+    if parser != "C":
+        try:
+            if parser == "PyArrow":
+                data = read_text_pyarrow(file, method, progress, cancel)
+            else:
+                data = read_text_numpy(file, method, progress, cancel)
+        except Load_Cancelled:
+            raise
+        except Exception as e:
+            logging.warning("%s parser can't read %s (%s), falling back on the C parser" % (parser, file, e))
+            parser = "C"
+    if data is None and any(time_window(method)):
+        # parse in chunks, keeping only the rows inside the time window
+        pieces = []
+        with open_data_file(file, progress, cancel) as f:
+            reader = pd.read_csv(f, header=header_rows(method), sep=DELIMITERS[method["Delimiter"]], skip_blank_lines=False,
+                                 usecols=use_columns(method), chunksize=method.get("Chunk_Size", 100000), **row_window_args(method))
+            for chunk in reader:
+                chunk = convert_datetime_columns(chunk, method)
+                pieces.append(window_times(chunk, method))
+                if window_ended(chunk, method):
+                    break
+        data = pd.concat(pieces) if pieces else pd.DataFrame(columns=read_header(file, method))
+    elif data is None:
+        with open_data_file(file, progress, cancel) as f:
+            data = pd.read_csv(f, header=header_rows(method), sep=DELIMITERS[method["Delimiter"]], skip_blank_lines=False,
+                               usecols=use_columns(method), **row_window_args(method))
+    logging.info("Parsed %s with the %s parser in %.3f s" % (file, parser, time.perf_counter() - start))
+    return data
+
+
+def read_text_pyarrow(file, method, progress=None, cancel=None):
+    # multithreaded parse, usecols has to be a list of names for pyarrow
+    usecols = use_columns(method)
+    if usecols is not None:
+        usecols = [col for col in read_header(file, method) if usecols(col)]
+    with open_data_file(file, progress, cancel) as f:
+        data = pd.read_csv(f, header=header_rows(method), sep=DELIMITERS[method["Delimiter"]], skip_blank_lines=False,
+                           usecols=usecols, engine="pyarrow")
+    # pyarrow infers timestamps on its own, keep them in the same unit as the other parsers
+    for col in data.columns:
+        if data[col].dtype.kind == "M" and data[col].dtype != "datetime64[ns]":
+            data[col] = data[col].astype("datetime64[ns]")
+    return data
+
+
+def read_text_numpy(file, method, progress=None, cancel=None):
+    # fast path for files that are only numbers, raises on anything else
+    header = read_header(file, method)
+    usecols = use_columns(method)
+    columns = [i for i, col in enumerate(header) if usecols is None or usecols(col)]
+    with open_data_file(file, progress, cancel) as f:
+        values = np.loadtxt(f, delimiter=DELIMITERS[method["Delimiter"]], skiprows=header_rows(method) + 1,
+                            usecols=columns, ndmin=2, dtype=np.float64, encoding=None)
+    data = pd.DataFrame(values, columns=[header[i] for i in columns])
+    # loadtxt reads everything as floats, whole number columns go back to int64 like the other parsers give
+    for col in data.columns:
+        column = data[col].to_numpy()
+        if len(column) and (np.abs(column) < 2**53).all() and (column == np.round(column)).all():
+            data[col] = column.astype(np.int64)
+    return data
+
+
+def read_data_file(file, method, progress=None, cancel=None):
+    # load in a single file using the settings from a file import method (.fim)
+    file_type = method["File_Type"].lower()
+    if cancel is not None and cancel.is_set():
+        raise Load_Cancelled()
+    if file_type == "text":
+        data = read_text_file(file, method, progress, cancel)
+    elif file_type == "spreadsheet":
+        data = pd.read_excel(file, sheet_name=method["Sheet"], header=header_rows(method), usecols=use_columns(method),
+                             **row_window_args(method))
+    elif file_type == "binary":
+        data = read_binary_file(file, method, progress)
+    else:
+        raise ValueError("Unknown file type %s" % method["File_Type"])
+
+    # datetime parsing is done after the parse, one column at a time
+    data = convert_datetime_columns(data, method)
+    data = window_times(data, method)
+
+    # shrink dtypes to save memory
+    data, saved = compact_data(data, method)
+    if saved > 0:
+        logging.info("Compacted %s, saved %.1f MB" % (file, saved / 1e6))
+        data.attrs["Bytes_Saved"] = saved
+    return data
+
+
+def single_precision_fits(values, single, tolerance):
+    # float32 is only lossless within the tolerance when its rounding error is within the tolerance of the column's range
+    # and under half the smallest step between values, so timestamps with a large offset keep their resolution
+    finite = np.isfinite(values)
+    if not (np.isfinite(single) == finite).all():
+        return False
+    values = values[finite]
+    if values.size == 0:
+        return True
+    error = np.abs(single[finite].astype(np.float64) - values).max()
+    if error == 0:
+        return True
+    if error > tolerance * (values.max() - values.min()):
+        return False
+    steps = np.diff(np.unique(values))
+    return steps.size == 0 or error < steps.min() / 2
+
+
+def compact_data(data, method, exact=()):
+    # shrink column dtypes following the precision policy of the file import method
+    # columns listed in exact only go to single precision on auto when every value survives unchanged
+    # returns the data and the number of bytes saved
+    precision = method.get("Precision", "Full")
+    if precision == "Full" or data.empty:
+        return data, 0
+    tolerance = float(method.get("Precision_Tolerance", 1e-6))
+    before = data.memory_usage(deep=True).sum()
+    for col in data.columns:
+        values = data[col]
+        # sparse, categorical and other extension columns are already compact
+        if not isinstance(values.dtype, np.dtype):
+            continue
+        kind = values.dtype.kind
+        if kind == "f" and values.dtype.itemsize > 4:
+            single = values.astype(np.float32)
+            if precision == "Single" or single_precision_fits(values.to_numpy(), single.to_numpy(), 0 if col in exact else tolerance):
+                data[col] = single
+        elif kind in "iu":
+            data[col] = pd.to_numeric(values, downcast="integer" if values.min() < 0 else "unsigned")
+        elif kind == "O" and values.nunique() <= len(values) // 2:
+            # text with few distinct values, like modes and states
+            data[col] = values.astype("category")
+    return data, before - data.memory_usage(deep=True).sum()
+
+
+def compact_chunk(data, method):
+    # give a streamed chunk a layout that every later chunk can be appended to
+    # numbers are stored as floats since a later chunk may have missing values,
+    # each chunk is checked against the tolerance on its own and the store widens the column if one fails it
+    # whole numbers like counters must come back exactly, not just within the tolerance
+    exact = []
+    for col in data.columns:
+        if data[col].dtype.kind in "biu":
+            data[col] = data[col].astype(np.float64)
+            exact.append(col)
+    return compact_data(data, method, exact)[0]
+
+
+def combine_frames(frames):
+    # concatenate the per-file frames in one go
+    if not frames:
+        return pd.DataFrame()
+    # files skipped by a time window don't take part
+    frames = [data for data in frames if not data.empty] or frames[:1]
+
+    # give categorical columns the same categories in every frame so they stay categorical
+    if len(frames) > 1:
+        for col in frames[0].columns:
+            if not all(col in data.columns and isinstance(data[col].dtype, pd.CategoricalDtype) for data in frames):
+                continue
+            categories = frames[0][col].cat.categories
+            for data in frames[1:]:
+                categories = categories.append(data[col].cat.categories.difference(categories))
+            for data in frames:
+                data[col] = data[col].cat.set_categories(categories)
+
+    # carry over how much memory compaction saved
+    saved = sum(data.attrs.get("Bytes_Saved", 0) for data in frames)
+    # a single frame is used as is so memory mapped columns aren't copied
+    if len(frames) == 1:
+        data = frames[0]
+    elif all(list(data.columns) == list(frames[0].columns) for data in frames):
+        data = pd.concat(frames)
+    else:
+        data = union_frames(frames)
+    data.attrs["Bytes_Saved"] = saved
+    return data
+
+
+def union_frames(frames):
+    # stack frames that have different columns, e.g. when channels were added to a logger part way through a test
+    # the union of the columns is built column by column with one allocation each, and number columns that are
+    # missing from some files are stored sparse so the missing rows take no memory
+    columns = list(dict.fromkeys(col for data in frames for col in data.columns))
+    starts = np.cumsum([0] + [len(data) for data in frames])
+    index = frames[0].index.append([data.index for data in frames[1:]])
+    union = {}
+    for col in columns:
+        present = [i for i, data in enumerate(frames) if col in data.columns]
+        parts = [frames[i][col] for i in present]
+        if len(present) == len(frames):
+            union[col] = pd.concat(parts, ignore_index=True).array
+        elif all(isinstance(part.dtype, np.dtype) and part.dtype.kind in "iuf" for part in parts):
+            # only the present values and their row numbers are stored, the missing rows are never filled in
+            values = np.concatenate([part.to_numpy(dtype=np.float64) for part in parts])
+            rows = np.concatenate([np.arange(starts[i], starts[i+1], dtype=np.int32) for i in present])
+            union[col] = pd.arrays.SparseArray(values, sparse_index=SPARSE_INDEX(len(index), rows), fill_value=np.nan)
+        else:
+            # text, times and categories are filled in with missing values of their own dtype, e.g. NaT or a missing category
+            fill = parts[0].array
+            union[col] = pd.concat([data[col] if col in data.columns else pd.Series(fill.take(np.full(len(data), -1), allow_fill=True))
+                                    for data in frames], ignore_index=True).array
+    return pd.DataFrame(union, index=index, columns=columns, copy=False)
+
+
+def interleave_frames(frames, col):
+    # k-way merge of frames that are each sorted by col, every row is written straight to its place in the output
+    # so the merged frame is built once instead of being concatenated and then put in order
+    times = [data[col].to_numpy() for data in frames]
+    places = []
+    for i, time in enumerate(times):
+        # a row's place is its own row number plus the rows of the other files that come before it,
+        # rows with the same time keep the order of the files
+        place = np.arange(len(time))
+        for j, other in enumerate(times):
+            if j == i or other[0] > time[-1]:
+                continue
+            if other[-1] < time[0]:
+                place += len(other)
+            else:
+                place += np.searchsorted(other, time, side="right" if j < i else "left")
+        places.append(place)
+    total = sum(len(time) for time in times)
+
+    columns = list(dict.fromkeys(c for data in frames for c in data.columns))
+    merged = {}
+    for c in columns:
+        parts = [data[c] for data in frames if c in data.columns]
+        dtypes = [part.dtype for part in parts]
+        if len(parts) < len(frames) or not all(isinstance(dtype, np.dtype) for dtype in dtypes):
+            continue
+        if all(dtype == dtypes[0] for dtype in dtypes):
+            values = np.empty(total, dtype=dtypes[0])
+        elif all(dtype.kind in "iuf" for dtype in dtypes):
+            values = np.empty(total, dtype=np.result_type(*dtypes))
+        else:
+            continue
+        for part, place in zip(parts, places):
+            values[place] = part.to_numpy()
+        merged[c] = values
+
+    # categorical, sparse and partly present columns are concatenated and then put in order,
+    # the time column comes along so no file is left out for having none of these columns
+    rest = [c for c in columns if c not in merged]
+    if rest:
+        order = np.empty(total, dtype=np.intp)
+        order[np.concatenate(places)] = np.arange(total)
+        other = combine_frames([pd.DataFrame({c:data[c] for c in [col] + rest if c in data.columns}, copy=False) for data in frames])
+        for c in rest:
+            merged[c] = other[c].array.take(order)
+    data = pd.DataFrame({c:merged[c] for c in columns}, copy=False)
+    data.attrs["Bytes_Saved"] = sum(data.attrs.get("Bytes_Saved", 0) for data in frames)
+    return data
+
+
+def merge_frames(frames, method):
+    # merge the per-file frames into one dataset ordered by the time column
+    # each file is only sorted if it isn't sorted already, files that don't overlap are just concatenated
+    # and overlapping files are interleaved by a k-way merge of their sorted times
+    frames = [data for data in frames if not data.empty]
+    if len(frames) == 0:
+        return pd.DataFrame()
+    col = window_time_column(frames[0].columns, method)
+    if any(col not in data.columns for data in frames):
+        logging.warning("Can't merge by time, %s is missing from some files" % col)
+        return combine_frames(frames)
+
+    # rows without a time, like blank lines, have no place in a time ordered dataset
+    for i, data in enumerate(frames):
+        missing = data[col].isna().to_numpy()
+        if missing.any():
+            logging.info("Dropped %d rows without a time from the merge" % missing.sum())
+            frames[i] = data = data[~missing]
+        if not data[col].is_monotonic_increasing:
+            frames[i] = data.sort_values(col, kind="stable")
+    frames = [data for data in frames if not data.empty]
+    if len(frames) == 0:
+        return pd.DataFrame()
+    frames.sort(key=lambda data: data[col].iloc[0])
+    overlap = any(frames[i][col].iloc[0] < frames[i-1][col].iloc[-1] for i in range(1, len(frames)))
+    data = interleave_frames(frames, col) if overlap else combine_frames(frames)
+    times = data[col].to_numpy()
+
+    # drop rows with the same timestamp as the row before
+    keep = np.ones(len(times), dtype=bool)
+    keep[1:] = times[1:] != times[:-1]
+    if not keep.all():
+        logging.info("Dropped %d rows with duplicate timestamps" % (len(keep) - keep.sum()))
+        data = data[keep]
+    return data.reset_index(drop=True)
+
+
+def stream_data_file(file, method, cache=None, progress=None, cancel=None):
+    # parse a text file in chunks, appending each chunk straight into a column store
+    # only one chunk is held as text at a time and the finished store is memory mapped
+    if cache is not None:
+        folder = cache.temp_folder(file, method)
+    else:
+        folder = tempfile.mkdtemp(prefix="Plot_Bot_")
+        atexit.register(shutil.rmtree, folder, True)
+    store = Column_Store(folder)
+    try:
+        with open_data_file(file, progress, cancel) as f:
+            reader = pd.read_csv(f, header=header_rows(method), sep=DELIMITERS[method["Delimiter"]], skip_blank_lines=False,
+                                 usecols=use_columns(method), chunksize=method.get("Chunk_Size", 100000), **row_window_args(method))
+            for chunk in reader:
+                chunk = convert_datetime_columns(chunk, method)
+                store.append(compact_chunk(window_times(chunk, method), method))
+                if window_ended(chunk, method):
+                    break
+        store.close()
+    except BaseException:
+        shutil.rmtree(folder, ignore_errors=True)
+        raise
+
+    if cache is not None:
+        folder = cache.commit(folder, file, method)
+    return Column_Store.read(folder)
+
+
+# worker processes that parse workbooks, started with the first workbook that is loaded
+workbook_pool = None
+workbook_pool_lock = threading.Lock()
+
+
+def get_workbook_pool():
+    # parsing workbook xml holds the gil, so workbooks are parsed in their own processes
+    global workbook_pool
+    with workbook_pool_lock:
+        if workbook_pool is None:
+            workbook_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+        return workbook_pool
+
+
+def workbook_sheets(file, method):
+    # sheets to load from a workbook, the Sheet of a file import method can be a list of sheets or * for every sheet
+    sheet = method.get("Sheet", "")
+    if not isinstance(sheet, str):
+        return [sheet]
+    if sheet.strip() == "":
+        return [0]
+    if sheet.strip() == "*":
+        with pd.ExcelFile(file) as workbook:
+            return workbook.sheet_names
+    return [name.strip() for name in sheet.split(",") if name.strip() != ""]
+
+
+def wait_for_result(future, cancel=None):
+    # wait on a worker process, checking for a cancelled load while waiting
+    while True:
+        try:
+            return future.result(timeout=0.2)
+        except TimeoutError:
+            if cancel is not None and cancel.is_set():
+                future.cancel()
+                raise Load_Cancelled()
+
+
+def read_cached_workbook(file, method, cache=None, progress=None, cancel=None):
+    # parse the sheets of a workbook in worker processes, caching each sheet on its own
+    # the sheets are stacked in the order they are listed
+    if cancel is not None and cancel.is_set():
+        raise Load_Cancelled()
+    sheets = workbook_sheets(file, method)
+    frames = []
+    futures = {}
+    for i, sheet in enumerate(sheets):
+        sheet_method = dict(method, Sheet=sheet)
+        data = cache.load(file, sheet_method) if cache is not None else None
+        if data is None:
+            futures[i] = get_workbook_pool().submit(read_data_file, file, sheet_method)
+        frames.append(data)
+
+    size = os.path.getsize(file)
+    for i, future in futures.items():
+        frames[i] = wait_for_result(future, cancel)
+        if cache is not None:
+            cache.store(file, dict(method, Sheet=sheets[i]), frames[i])
+        if progress is not None:
+            progress(file, size // len(futures), False)
+    return combine_frames(frames)
+
+
+def read_cached_file(file, method, cache=None, progress=None, cancel=None):
+    # use the parsed copy of the file if it is cached, otherwise parse it and cache the result
+    if outside_time_window(file, method):
+        logging.info("Skipped %s, it is outside the time window" % file)
+        return pd.DataFrame()
+    if method["File_Type"].lower() == "binary":
+        # binary files are memory mapped already, caching them would only copy them
+        cache = None
+    if method["File_Type"].lower() == "spreadsheet":
+        return read_cached_workbook(file, method, cache, progress, cancel)
+    if cache is not None:
+        data = cache.load(file, method)
+        if data is not None:
+            return data
+    if method["File_Type"].lower() == "text" and method.get("Import_Mode", "Standard") == "Streaming":
+        return stream_data_file(file, method, cache, progress, cancel)
+    data = read_data_file(file, method, progress, cancel)
+    if cache is not None:
+        cache.store(file, method, data)
+    return data
+
+
+def load_data_files(files, method, cache=None, progress=None, cancel=None):
+    # parse all files in parallel, then concatenate once at the end
+    # results are collected in submission order so the ctime-sorted file order is kept
+    # progress is called as progress(file, bytes read, file done) and cancel is a threading event
+    frames = []
+    loaded_files = []
+    import_success = True
+    with ThreadPoolExecutor() as executor:
+        futures = [executor.submit(read_cached_file, file, method, cache, progress, cancel) for file in files]
+        try:
+            for file, future in zip(files, futures):
+                try:
+                    frames.append(future.result())
+                    loaded_files.append([file, len(frames[-1])])
+                except (Load_Cancelled, CancelledError):
+                    raise Load_Cancelled()
+                except Exception:
+                    logging.exception("Exception thrown while loading in %s!" % file)
+                    import_success = False
+                if progress is not None:
+                    progress(file, 0, True)
+        except Load_Cancelled:
+            # drop files that haven't started, running files stop at their next read
+            for future in futures:
+                future.cancel()
+            raise
+
+    # keep the cache within its size limit
+    if cache is not None:
+        cache.evict()
+
+    # keep track of which rows came from which file
+    if method.get("Merge_By_Time", False):
+        data = merge_frames(frames, method)
+    else:
+        data = combine_frames(frames)
+    data.attrs["Files"] = loaded_files
+    return data, import_success
+
+
+def complete_line_offset(file):
+    # byte offset just past the last complete line of a file
+    size = os.path.getsize(file)
+    with open(file, "rb") as f:
+        end = size
+        while end > 0:
+            start = max(end - 65536, 0)
+            f.seek(start)
+            i = f.read(end - start).rfind(b"\n")
+            if i >= 0:
+                return start + i + 1
+            end = start
+    return 0
+
+
+def read_new_rows(file, offset, header, method):
+    # parse the complete lines appended to a text file since the given byte offset
+    # returns the new rows (None if there aren't any) and the offset to continue from
+    with open(file, "rb") as f:
+        f.seek(offset)
+        text = f.read()
+    end = text.rfind(b"\n")
+    if end < 0:
+        return None, offset
+    data = pd.read_csv(io.BytesIO(text[:end+1]), header=None, names=header, sep=DELIMITERS[method["Delimiter"]],
+                       skip_blank_lines=False, usecols=use_columns(method))
+    return window_times(convert_datetime_columns(data, method), method), offset + end + 1
+
+
+def partial_row(file, offset, header, data, method):
+    # position in merged data of the row parsed from the partly written last line of a file, None if it isn't there
+    with open(file, "rb") as f:
+        f.seek(offset)
+        tail = f.read()
+    row = pd.read_csv(io.BytesIO(tail + b"\n"), header=None, names=header, sep=DELIMITERS[method["Delimiter"]],
+                      usecols=use_columns(method))
+    row = convert_datetime_columns(row, method)
+    col = window_time_column(data.columns, method)
+    if len(row) != 1 or col not in data.columns or pd.isna(row[col].iloc[0]):
+        return None
+    candidates = np.flatnonzero((data[col] == row[col].iloc[0]).to_numpy())
+    # another file's row can have the same time, so the other values have to match too
+    for i in candidates[::-1]:
+        same = True
+        for name in row.columns:
+            if name not in data.columns:
+                continue
+            a, b = data[name].iloc[i], row[name].iloc[0]
+            if pd.isna(a) and pd.isna(b):
+                continue
+            if isinstance(a, (int, float, np.number)) and isinstance(b, (int, float, np.number)):
+                same = np.isclose(a, b, rtol=1e-6)
+            else:
+                same = str(a) == str(b)
+            if not same:
+                break
+        if same:
+            return i
+    return None
+
+
+class Data_Buffer:
+    # column buffers with spare room at the end, so appended rows are written in place
+    # instead of copying the whole dataset with pd.concat
+    # frame() hands out a dataframe of views onto the filled part of the buffers
+    def __init__(self, data):
+        self.columns = list(data.columns)
+        self.rows = len(data)
+        self.capacity = self.rows + max(self.rows // 4, 10000)
+        self.buffers = {}
+        self.categories = {}
+        self.last_frame = None
+        for col in self.columns:
+            values = data[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # categoricals are kept as codes, new categories are added as they show up
+                self.categories[col] = values.cat.categories
+                arr = values.cat.codes.to_numpy().astype(np.int32)
+            else:
+                arr = values.to_numpy()
+            self.buffers[col] = np.empty(self.capacity, dtype=arr.dtype)
+            self.buffers[col][:self.rows] = arr
+
+    def append(self, data):
+        n = len(data)
+        if n == 0:
+            return
+
+        # grow all buffers when full, leaving extra room so this rarely happens
+        if self.rows + n > self.capacity:
+            self.capacity = self.rows + n + max((self.rows + n) // 4, 10000)
+            for col in self.columns:
+                buf = np.empty(self.capacity, dtype=self.buffers[col].dtype)
+                buf[:self.rows] = self.buffers[col][:self.rows]
+                self.buffers[col] = buf
+
+        for col in self.columns:
+            buf = self.buffers[col]
+            if col in self.categories:
+                values = data[col] if col in data.columns else pd.Series([None] * n, dtype=object)
+                codes = self.categories[col].get_indexer(values)
+                new = pd.Index(values[(codes == -1) & values.notna().to_numpy()].unique())
+                if len(new) > 0:
+                    self.categories[col] = self.categories[col].append(new)
+                    codes = self.categories[col].get_indexer(values)
+                buf[self.rows:self.rows+n] = codes
+                continue
+
+            if col in data.columns:
+                values = data[col].to_numpy()
+                # floats keep the precision picked at load, anything else widens the buffer if needed
+                if not (buf.dtype.kind == "f" and values.dtype.kind == "f"):
+                    dtype = np.result_type(buf.dtype, values.dtype)
+                    if dtype != buf.dtype:
+                        buf = self.buffers[col] = buf.astype(dtype)
+            else:
+                # column isn't in the new rows, fill with missing values
+                if buf.dtype.kind in "biu":
+                    buf = self.buffers[col] = buf.astype(np.float64)
+                if buf.dtype.kind == "M":
+                    values = np.datetime64("NaT")
+                elif buf.dtype.kind == "O":
+                    values = None
+                else:
+                    values = np.nan
+            buf[self.rows:self.rows+n] = values
+        self.rows += n
+
+    def frame(self):
+        columns = {}
+        for col in self.columns:
+            view = self.buffers[col][:self.rows]
+            if col in self.categories:
+                columns[col] = pd.Categorical.from_codes(view, categories=self.categories[col])
+            else:
+                columns[col] = view
+        self.last_frame = pd.DataFrame(columns, columns=self.columns, copy=False)
+        return self.last_frame
+
+
+class File_Loader(QThread):
+    # loads data files off of the GUI thread, reporting progress through signals
+    progress = pyqtSignal(int, int, int, int)
+    loaded = pyqtSignal(object, bool)
+
+    def __init__(self, files, method, cache=None):
+        QThread.__init__(self)
+        self.files = files
+        self.method = method
+        self.cache = cache
+        # columns left out of a projected load, these can be loaded later on demand
+        self.lazy_columns = []
+        # for on demand loads, the data the columns are for and what to do once they are in
+        self.target = None
+        self.then = None
+        self.cancel_event = threading.Event()
+        self.lock = threading.Lock()
+
+        # progress is tracked in bytes, a finished file counts as fully read
+        self.sizes = {file:os.path.getsize(file) for file in files}
+        self.total_bytes = max(sum(self.sizes.values()), 1)
+        self.file_bytes = {file:0 for file in files}
+        self.bytes_read = 0
+        self.files_done = 0
+        self.permille = -1
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def report(self, file, n, done):
+        # called from the worker threads
+        with self.lock:
+            if done:
+                n = self.sizes[file] - self.file_bytes[file]
+                self.files_done += 1
+            else:
+                n = min(n, self.sizes[file] - self.file_bytes[file])
+            self.file_bytes[file] += n
+            self.bytes_read += n
+            # only signal when the displayed value changes so the GUI isn't flooded
+            permille = self.bytes_read * 1000 // self.total_bytes
+            if done or permille != self.permille:
+                self.permille = permille
+                self.progress.emit(self.files_done, len(self.files), permille, 1000)
+
+    def run(self):
+        try:
+            data, import_success = load_data_files(self.files, self.method, self.cache, self.report, self.cancel_event)
+        except Load_Cancelled:
+            logging.info("File load cancelled")
+            data, import_success = None, True
+        except Exception:
+            logging.exception("Exception thrown while loading in file(s)!")
+            data, import_success = None, False
+        self.loaded.emit(data, import_success)
+
+
+class Column_Store:
+    # on-disk columnar storage, one binary file per column plus an hjson manifest
+    # numeric, boolean and datetime columns are stored raw and memory mapped when read back,
+    # categoricals are stored as their codes and any other text is pickled, so a read gives back the dtypes that were stored
+    def __init__(self, folder):
+        self.folder = folder
+        self.columns = []
+        self.codes = {}
+        self.rows = 0
+        os.makedirs(self.folder, exist_ok=True)
+
+    def append(self, data):
+        # the first frame appended sets the column layout
+        if not self.columns:
+            for i, name in enumerate(data.columns):
+                if not isinstance(name, str):
+                    raise ValueError("Only named columns can be stored, got %s" % repr(name))
+                dtype = data[name].dtype
+                if isinstance(dtype, np.dtype) and dtype.kind in "biufM":
+                    self.columns.append({"Name":name, "File":"%d.bin" % i, "Kind":"Values", "Dtype":dtype.str})
+                elif isinstance(dtype, pd.CategoricalDtype):
+                    self.columns.append({"Name":name, "File":"%d.bin" % i, "Kind":"Category", "Dtype":"<i4"})
+                    self.codes[name] = {}
+                else:
+                    self.columns.append({"Name":name, "File":"%d.npy" % i, "Kind":"Object", "Dtype":"|O"})
+
+        # append each column to its file, changing its layout first if the frame doesn't fit it
+        for col in self.columns:
+            self.write(col, self.fit(col, data[col["Name"]]))
+        self.rows += len(data)
+
+    def fit(self, col, values):
+        # values of a later frame that fit the stored column, the column is rewritten when they don't
+        if col["Kind"] != "Values":
+            return values
+        stored = np.dtype(col["Dtype"])
+        if values.isna().all():
+            # an empty column fits any layout that can hold missing values
+            if stored.kind == "M":
+                return pd.Series(np.full(len(values), np.datetime64("NaT"), dtype=stored))
+            if stored.kind != "f":
+                self.relayout(col, "Values", np.dtype(np.float64))
+            return pd.Series(np.full(len(values), np.nan))
+        if isinstance(values.dtype, np.dtype) and values.dtype.kind in "biuf" and stored.kind in "biuf":
+            # a chunk that needs more precision than the earlier ones widens the whole column
+            target = np.result_type(stored, values.dtype)
+            if target != stored:
+                self.relayout(col, "Values", target)
+            return values
+        if isinstance(values.dtype, np.dtype) and values.dtype.kind == "M" and stored.kind == "M":
+            return values
+        # text in a number or datetime column, keep every value by storing the column as objects
+        self.relayout(col, "Object", np.dtype(object))
+        return values
+
+    def stored_values(self, col):
+        # every row written to a column so far
+        path = os.path.join(self.folder, col["File"])
+        if col["Kind"] == "Object":
+            return Column_Store.load_objects(path)
+        if os.path.exists(path):
+            arr = np.fromfile(path, dtype=np.dtype(col["Dtype"]))
+        else:
+            arr = np.empty(0, dtype=np.dtype(col["Dtype"]))
+        if col["Kind"] == "Category":
+            categories = np.empty(len(self.codes[col["Name"]]), dtype=object)
+            categories[:] = list(self.codes[col["Name"]])
+            values = np.full(len(arr), np.nan, dtype=object)
+            values[arr >= 0] = categories[arr[arr >= 0]]
+            return values
+        return arr
+
+    def relayout(self, col, kind, dtype):
+        # rewrite a column in a layout that the new frame fits too
+        values = pd.Series(self.stored_values(col))
+        path = os.path.join(self.folder, col["File"])
+        if os.path.exists(path):
+            os.remove(path)
+        logging.info("Storing column %s as %s %s" % (col["Name"], kind, dtype))
+        col["Kind"] = kind
+        col["Dtype"] = dtype.str
+        col["File"] = os.path.splitext(col["File"])[0] + (".npy" if kind == "Object" else ".bin")
+        self.write(col, values)
+
+    def write(self, col, values):
+        # append values to a column's file
+        if col["Kind"] == "Values":
+            arr = values.to_numpy(dtype=np.dtype(col["Dtype"]))
+        elif col["Kind"] == "Object":
+            # text is pickled, one array per appended frame
+            with open(os.path.join(self.folder, col["File"]), "ab") as f:
+                np.save(f, values.to_numpy(dtype=object), allow_pickle=True)
+            return
+        else:
+            # factorize the chunk, then map its categories onto the codes stored so far
+            chunk_codes, uniques = pd.factorize(values)
+            lookup = self.codes[col["Name"]]
+            mapping = np.empty(len(uniques) + 1, dtype=np.int32)
+            mapping[-1] = -1
+            for j, value in enumerate(uniques):
+                mapping[j] = lookup.setdefault(value, len(lookup))
+            arr = mapping[chunk_codes]
+        with open(os.path.join(self.folder, col["File"]), "ab") as f:
+            np.ascontiguousarray(arr).tofile(f)
+
+    def close(self):
+        # save categories and the manifest, the manifest is written last so a partial store is never read
+        for col in self.columns:
+            if col["Kind"] == "Category":
+                categories = np.empty(len(self.codes[col["Name"]]), dtype=object)
+                categories[:] = list(self.codes[col["Name"]])
+                np.save(os.path.join(self.folder, col["File"] + ".cat.npy"), categories, allow_pickle=True)
+        with open(os.path.join(self.folder, "manifest.hjson"), "w") as f:
+            hjson.dump({"Rows":self.rows, "Columns":self.columns}, f)
+
+    @staticmethod
+    def load_objects(path):
+        # read every pickled array appended to an object column file
+        parts = []
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                while f.tell() < os.fstat(f.fileno()).st_size:
+                    parts.append(np.load(f, allow_pickle=True))
+        return np.concatenate(parts) if parts else np.empty(0, dtype=object)
+
+    @staticmethod
+    def read(folder):
+        # memory map every column file back into a dataframe
+        with open(os.path.join(folder, "manifest.hjson"), "r") as f:
+            manifest = hjson.load(f)
+        rows = manifest["Rows"]
+        columns = {}
+        for col in manifest["Columns"]:
+            if col["Kind"] == "Object":
+                columns[col["Name"]] = Column_Store.load_objects(os.path.join(folder, col["File"]))
+                continue
+            dtype = np.dtype(col["Dtype"])
+            if rows > 0:
+                arr = np.memmap(os.path.join(folder, col["File"]), dtype=dtype, mode="r", shape=(rows,))
+            else:
+                arr = np.empty(0, dtype=dtype)
+            if col["Kind"] == "Category":
+                categories = np.load(os.path.join(folder, col["File"] + ".cat.npy"), allow_pickle=True)
+                arr = pd.Categorical.from_codes(arr, categories=pd.Index(categories))
+            columns[col["Name"]] = arr
+        return pd.DataFrame(columns, columns=[col["Name"] for col in manifest["Columns"]], copy=False)
+
+
+class Data_Cache:
+    # local cache of parsed files, keyed by file path, size, modification time and file import method settings
+    # entries are kept in least recently used order via the manifest modification time
+    def __init__(self, folder, max_size_mb):
+        self.folder = folder
+        self.max_size = max_size_mb * 1024 * 1024
+        self.lock = threading.Lock()
+
+    def key(self, file, method):
+        stat = os.stat(file)
+        # merging happens after the files are parsed, so it doesn't change what is cached
+        method = {key: value for key, value in method.items() if key != "Merge_By_Time"}
+        text = hjson.dumpsJSON([os.path.abspath(file), stat.st_size, stat.st_mtime_ns, method], sort_keys=True)
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    def load(self, file, method):
+        try:
+            folder = os.path.join(self.folder, self.key(file, method))
+            manifest = os.path.join(folder, "manifest.hjson")
+            if not os.path.exists(manifest):
+                return None
+            # mark entry as recently used
+            os.utime(manifest)
+            data = Column_Store.read(folder)
+            logging.info("Loaded %s from cache" % file)
+            return data
+        except Exception:
+            logging.exception("Exception thrown while reading %s from cache!" % file)
+            return None
+
+    def temp_folder(self, file, method):
+        # entries are written to a temporary folder first, then moved into place
+        return os.path.join(self.folder, "%s.%d.%d.tmp" % (self.key(file, method), os.getpid(), threading.get_ident()))
+
+    def commit(self, temp, file, method):
+        # move a finished entry into place, returning the entry folder
+        folder = os.path.join(self.folder, self.key(file, method))
+        try:
+            os.rename(temp, folder)
+        except OSError:
+            # someone else cached the same file first
+            shutil.rmtree(temp, ignore_errors=True)
+        return folder
+
+    def store(self, file, method, data):
+        try:
+            if os.path.exists(os.path.join(self.folder, self.key(file, method))):
+                return
+            temp = self.temp_folder(file, method)
+            store = Column_Store(temp)
+            store.append(data)
+            store.close()
+            self.commit(temp, file, method)
+        except Exception:
+            logging.exception("Exception thrown while caching %s!" % file)
+
+    def evict(self):
+        # remove least recently used entries until the cache fits in its size limit
+        with self.lock:
+            entries = []
+            total = 0
+            for name in os.listdir(self.folder):
+                folder = os.path.join(self.folder, name)
+                manifest = os.path.join(folder, "manifest.hjson")
+                if name.endswith(".tmp") or not os.path.exists(manifest):
+                    continue
+                size = sum(entry.stat().st_size for entry in os.scandir(folder))
+                entries.append((os.path.getmtime(manifest), size, folder))
+                total += size
+            entries.sort()
+            for _, size, folder in entries:
+                if total <= self.max_size:
+                    break
+                shutil.rmtree(folder, ignore_errors=True)
+                total -= size
+
+
+def m4_indices(x, y, bins):
+    # rows to keep so a line chart looks the same at a width of bins pixels (M4 decimation)
+    # the first, last, min and max row of every pixel column are kept, so peaks are never lost
+    n = len(y)
+    if x is not None and n > 1 and x[-1] > x[0]:
+        # sorted x values are split into equally wide pixel columns
+        edges = np.linspace(x[0], x[-1], bins + 1)[:-1]
+        starts = np.unique(np.searchsorted(x, edges, side="left"))
+    else:
+        # otherwise each column gets the same number of rows
+        starts = np.unique(np.linspace(0, n, bins + 1).astype(np.int64)[:-1])
+    ends = np.append(starts[1:], n)
+    counts = ends - starts
+    segment = np.repeat(np.arange(len(starts)), counts)
+
+    # min and max of each column, nan values are ignored
+    mins = np.fmin.reduceat(y, starts)
+    maxs = np.fmax.reduceat(y, starts)
+    keep = [starts, ends - 1]
+    for extreme in [mins, maxs]:
+        rows = np.flatnonzero(y == extreme[segment])
+        # the first matching row of each column
+        keep.append(rows[np.unique(segment[rows], return_index=True)[1]])
+    return np.unique(np.concatenate(keep))
+
+
+def decimate_line(x, y, threshold, bins):
+    # downsample a line trace with more than threshold points, returns the x and y to plot and if it was decimated
+    if threshold <= 0 or len(y) <= threshold or y.dtype.kind not in "iuf":
+        return x, y, False
+    x_values = x.to_numpy()
+    if x_values.dtype.kind == "M":
+        x_values = x_values.view(np.int64)
+    elif x_values.dtype.kind not in "iuf":
+        x_values = None
+    if x_values is not None and not x.is_monotonic_increasing:
+        x_values = None
+    rows = m4_indices(x_values, y.to_numpy(dtype=np.float64), bins)
+    return x.iloc[rows], y.iloc[rows], True
+
+
+def typed_array(values):
+    # numpy array as a base64 plotly.js typed array, float32 when it keeps the values to well under a pixel
+    if values.dtype == np.float64:
+        finite = values[np.isfinite(values)]
+        if finite.size == 0:
+            values = values.astype(np.float32)
+        elif np.abs(finite).max() < 1e38:
+            error = np.abs(finite.astype(np.float32) - finite).max()
+            if error <= (finite.max() - finite.min()) * 1e-6:
+                values = values.astype(np.float32)
+    values = values.astype(values.dtype.newbyteorder("<"), copy=False)
+    return {"dtype": values.dtype.str[1:], "bdata": base64.b64encode(values.tobytes()).decode("ascii")}
+
+
+def date_array(values):
+    # datetimes as float64 milliseconds since epoch, which plotly.js reads on a date axis
+    ms = values.astype("datetime64[ns]").astype(np.int64) / 1e6
+    ms[np.isnat(values)] = np.nan
+    return {"dtype": "f8", "bdata": base64.b64encode(ms.astype("<f8").tobytes()).decode("ascii")}
+
+
+def pack_arrays(item):
+    # swap the arrays in a trace (or part of one) for typed arrays, returns the keys that held dates
+    dates = []
+    for key, value in item.items():
+        if isinstance(value, np.ndarray) and value.ndim == 1 and value.dtype.kind == "M" and key in ("x", "y", "z", "values"):
+            item[key] = date_array(value)
+            dates.append(key)
+        elif isinstance(value, np.ndarray) and value.ndim == 1 and value.dtype.str[1:] in TYPED_ARRAYS:
+            item[key] = typed_array(value)
+        elif isinstance(value, dict) and value.get("dtype") == "f8" and "bdata" in value:
+            packed = typed_array(np.frombuffer(base64.b64decode(value["bdata"]), dtype="<f8"))
+            if "shape" in value:
+                packed["shape"] = value["shape"]
+            item[key] = packed
+        elif isinstance(value, dict):
+            pack_arrays(value)
+    return dates
+
+
+def pack_trace(trace, layout=None):
+    # send a trace's arrays as base64 typed arrays instead of json text, date arrays need their axis set to date
+    dates = pack_arrays(trace)
+    for dimension in trace.get("dimensions", []):
+        if "values" in pack_arrays(dimension):
+            dimension.setdefault("axis", {})["type"] = "date"
+    if layout is None:
+        return trace
+    for key in dates:
+        if key not in ("x", "y", "z"):
+            continue
+        if "scene" in trace or trace.get("type", "").endswith("3d"):
+            scene = layout.setdefault(trace.get("scene", "scene"), {})
+            scene.setdefault(key + "axis", {}).setdefault("type", "date")
+        elif key != "z":
+            axis = key + "axis" + trace.get(key + "axis", key)[1:]
+            layout.setdefault(axis, {}).setdefault("type", "date")
+    return trace
+
+
+def histogram_bins(x, y, color, nbins, func, norm):
+    # bin x for each color group with numpy so only the bars go to the chart
+    # returns the group names, bin centers, bin widths and a groups x bins array of heights
+    keep = x.notna().to_numpy()
+    if y is not None:
+        keep &= y.notna().to_numpy()
+    x = x[keep]
+    if color is None:
+        codes = np.zeros(len(x), dtype=np.int64)
+        names = [None]
+    else:
+        codes, names = pd.factorize(color[keep], use_na_sentinel=False)
+        names = [str(name) for name in names]
+
+    # numbers and dates get evenly spaced bins, anything else is counted by category
+    if x.dtype.kind in "biufM":
+        dates = x.dtype.kind == "M"
+        if dates:
+            values = x.to_numpy().astype("datetime64[ns]").astype(np.int64)
+        else:
+            values = x.to_numpy(dtype=float)
+        if values.size == 0:
+            edges = np.array([0.0, 1.0])
+        elif nbins is None:
+            edges = np.histogram_bin_edges(values, bins="auto")
+            if len(edges) > 501:
+                edges = np.linspace(values.min(), values.max(), 501)
+        else:
+            edges = np.histogram_bin_edges(values, bins=nbins)
+        bins = np.clip(np.searchsorted(edges, values, side="right") - 1, 0, len(edges) - 2)
+        centers = (edges[:-1] + edges[1:]) / 2
+        widths = np.diff(edges)
+        if dates:
+            centers = centers.astype(np.int64).astype("datetime64[ns]")
+            # date axes measure bar widths in milliseconds
+            widths = widths / 1e6
+    else:
+        bins, centers = pd.factorize(x)
+        centers = np.asarray(centers, dtype=str)
+        widths = None
+    n_bins = len(centers)
+    key = codes * n_bins + bins
+    size = len(names) * n_bins
+
+    # without a y variable every sample counts as one
+    if y is None:
+        weights = np.ones(len(x))
+    else:
+        weights = y[keep].to_numpy(dtype=float)
+    count = np.bincount(key, minlength=size)
+    if func == "count":
+        heights = count.astype(float)
+    elif func in ("sum", "avg"):
+        heights = np.bincount(key, weights=weights, minlength=size)
+        if func == "avg":
+            with np.errstate(invalid="ignore", divide="ignore"):
+                heights = np.where(count > 0, heights / count, np.nan)
+    else:
+        heights = np.full(size, np.nan)
+        if len(key) > 0:
+            order = np.argsort(key, kind="stable")
+            sorted_key = key[order]
+            starts = np.flatnonzero(np.r_[True, sorted_key[1:] != sorted_key[:-1]])
+            reduce = np.minimum if func == "min" else np.maximum
+            heights[sorted_key[starts]] = reduce.reduceat(weights[order], starts)
+    heights = heights.reshape(len(names), n_bins)
+
+    # normalize each group on its own like plotly does
+    if norm is not None:
+        totals = np.nansum(heights, axis=1, keepdims=True)
+        totals[totals == 0] = np.nan
+        if norm == "percent":
+            heights = heights / totals * 100
+        elif norm == "probability":
+            heights = heights / totals
+        elif norm == "density":
+            heights = heights / (1 if widths is None else widths)
+        elif norm == "probability density":
+            heights = heights / totals / (1 if widths is None else widths)
+    return names, centers, widths, heights
+
+
+def grid_axis(series, bins, log=False):
+    # cell of every row along one axis of a density grid, returns the cell index, which rows are usable and the cell edges
+    if series.dtype.kind == "M":
+        values = series.to_numpy().astype("datetime64[ns]").astype(np.int64).astype(float)
+        values[series.isna().to_numpy()] = np.nan
+    else:
+        values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=float)
+    valid = np.isfinite(values)
+    if log:
+        valid &= values > 0
+        values = np.log10(values, where=valid, out=np.full(len(values), np.nan))
+    if valid.any():
+        low, high = values[valid].min(), values[valid].max()
+    else:
+        low, high = 0.0, 1.0
+    if high == low:
+        high = low + 1
+    index = np.zeros(len(values), dtype=np.int64)
+    index[valid] = np.clip(((values[valid] - low) / (high - low) * bins).astype(np.int64), 0, bins - 1)
+    edges = np.linspace(low, high, bins + 1)
+    if log:
+        edges = 10 ** edges
+    if series.dtype.kind == "M":
+        edges = edges.astype(np.int64).astype("datetime64[ns]")
+    return index, valid, edges
+
+
+def density_grid(x_axis, y_axis, color):
+    # count the rows in each cell of the grid made by two axes, or average the color variable when it's numeric
+    # returns the x edges, y edges, cell values and what the cell values are
+    x_index, x_valid, x_edges = x_axis
+    y_index, y_valid, y_edges = y_axis
+    valid = x_valid & y_valid
+    if color is not None and color.dtype.kind in "biuf":
+        weights = color.to_numpy(dtype=float)
+        valid &= np.isfinite(weights)
+        weights = weights[valid]
+    else:
+        color = None
+    shape = (len(y_edges) - 1, len(x_edges) - 1)
+    key = y_index[valid] * shape[1] + x_index[valid]
+    count = np.bincount(key, minlength=shape[0] * shape[1]).reshape(shape)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if color is None:
+            # counts span orders of magnitude so they are colored on a log scale
+            z = np.where(count > 0, np.log10(count), np.nan)
+            title = "log10 count"
+        else:
+            z = np.bincount(key, weights=weights, minlength=shape[0] * shape[1]).reshape(shape) / count
+            title = "mean of %s" % color.name
+    return x_edges, y_edges, z, title
+
+
+def use_webgl(mode, points, threshold):
+    # draw with webgl when asked to, or on auto when there are more points than svg can pan and zoom smoothly
+    if mode == "Auto":
+        return points > threshold
+    return mode == "WebGL"
+
+
+def relayout_x_range(event):
+    # x axis range from a plotly relayout event, returns if the range changed and the new range (None for autorange)
+    start = end = None
+    for key, value in event.items():
+        if re.fullmatch(r"xaxis\d*\.autorange", key) and value:
+            return True, None
+        if re.fullmatch(r"xaxis\d*\.range", key):
+            start, end = value
+        elif re.fullmatch(r"xaxis\d*\.range\[0\]", key):
+            start = value
+        elif re.fullmatch(r"xaxis\d*\.range\[1\]", key):
+            end = value
+    if start is None or end is None:
+        return False, None
+    return True, [start, end]
+
+
+def window_slice(x, window):
+    # rows of x inside a [start, end] window plus one row either side, found by binary search when x is sorted
+    if window is None:
+        return slice(None)
+    if x.dtype.kind == "M":
+        start, end = pd.Timestamp(window[0]), pd.Timestamp(window[1])
+    else:
+        start, end = float(window[0]), float(window[1])
+    if x.is_monotonic_increasing:
+        i = max(x.searchsorted(start, side="left") - 1, 0)
+        j = min(x.searchsorted(end, side="right") + 1, len(x))
+        return slice(i, j)
+    return ((x >= start) & (x <= end)).to_numpy()
+
+
+# page that every chart is drawn in, plotly.js is loaded from a local copy next to it
+PLOT_SHELL = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<script src="%s"></script>
+<script src="qrc:///qtwebchannel/qwebchannel.js"></script>
+<style>html, body { margin: 0; height: 100%%; overflow: hidden; } #plot { position: absolute; top: 0; bottom: 0; left: 0; right: 0; }</style>
+</head>
+<body>
+<div id="plot"></div>
+<script>
+// zoom and pan events are sent back to python over the web channel
+var bridge = null;
+var listening = false;
+if (typeof QWebChannel !== "undefined") {
+    new QWebChannel(qt.webChannelTransport, function(channel) {
+        bridge = channel.objects.bridge;
+    });
+}
+function listen(plot) {
+    if (!listening) {
+        plot.on("plotly_relayout", function(event) {
+            if (bridge !== null) {
+                bridge.relayout_event(JSON.stringify(event));
+            }
+        });
+        listening = true;
+    }
+}
+
+// the figure on the page, python only sends the traces and layout that changed
+var figureData = [];
+var figureLayout = {};
+
+// arrays come as base64 {dtype, bdata}, turned into typed arrays here since older plotly.js can't read them
+var typedArrays = {f4: Float32Array, f8: Float64Array, i1: Int8Array, i2: Int16Array, i4: Int32Array,
+                   u1: Uint8Array, u2: Uint16Array, u4: Uint32Array};
+function decode(item) {
+    if (item === null || typeof item !== "object") {
+        return item;
+    }
+    if (typeof item.bdata === "string" && typedArrays[item.dtype]) {
+        var text = atob(item.bdata);
+        var bytes = new Uint8Array(text.length);
+        for (var i = 0; i < text.length; i++) {
+            bytes[i] = text.charCodeAt(i);
+        }
+        var values = new typedArrays[item.dtype](bytes.buffer);
+        if (!item.shape) {
+            return values;
+        }
+        // 2d arrays like heatmap z are split into rows
+        var shape = String(item.shape).split(",").map(Number);
+        var rows = [];
+        for (var r = 0; r < shape[0]; r++) {
+            rows.push(values.subarray(r * shape[1], (r + 1) * shape[1]));
+        }
+        return rows;
+    }
+    for (var key in item) {
+        item[key] = decode(item[key]);
+    }
+    return item;
+}
+
+function update(changes) {
+    for (var i in changes.traces) {
+        figureData[i] = decode(changes.traces[i]);
+    }
+    figureData.length = changes.count;
+    if (changes.layout !== null) {
+        figureLayout = decode(changes.layout);
+    }
+    // a copy of the trace list so plotly sees which traces were replaced
+    Plotly.react("plot", figureData.slice(), figureLayout, {responsive: true}).then(listen);
+}
+</script>
+</body>
+</html>
+"""
+
+
+def write_plot_shell(folder):
+    # write plotly.js and the chart page into the temp plot folder once, returns the page path
+    plotly_js = "plotly-%s.min.js" % plotly.__version__
+    if not os.path.exists(os.path.join(folder, plotly_js)):
+        with open(os.path.join(folder, plotly_js), "w", encoding="utf-8") as file:
+            file.write(plotly.offline.get_plotlyjs())
+    shell = os.path.join(folder, "plot_shell.html")
+    with open(shell, "w", encoding="utf-8") as file:
+        file.write(PLOT_SHELL % plotly_js)
+    return shell
+
+
+class Plot_Bridge(QObject):
+    # object the chart page calls back into over the web channel
+    relayout = pyqtSignal(object)
+
+    @pyqtSlot(str)
+    def relayout_event(self, text):
+        self.relayout.emit(json.loads(text))
+
+
+class Plot_View(QWebEngineView):
+    # chart view that loads plotly.js once, figures are then updated in place with Plotly.react
+    # only the traces and layout that changed since the last draw are sent to the page,
+    # and the last figure is kept so it can be exported
+    def __init__(self, shell):
+        QWebEngineView.__init__(self)
+        self.shell = shell
+        self.figure = None
+        self.pending = None
+        self.ready = False
+        self.sent_traces = []
+        self.sent_layout = None
+        self.loadFinished.connect(self.shell_loaded)
+
+        # zoom and pan on the page come back through the bridge's relayout signal
+        self.bridge = Plot_Bridge()
+        self.channel = QWebChannel(self.page())
+        self.channel.registerObject("bridge", self.bridge)
+        self.page().setWebChannel(self.channel)
+        self.relayout = self.bridge.relayout
+
+    def show_figure(self, fig):
+        self.figure = fig
+        figure = fig.to_dict()
+        for trace in figure["data"]:
+            pack_trace(trace, figure["layout"])
+        # zoom and pan are kept across updates until different traces are drawn
+        revision = [[trace.get("name", ""), trace.get("xaxis", ""), trace.get("yaxis", "")] for trace in figure["data"]]
+        figure["layout"].setdefault("uirevision", plotly.io.json.to_json_plotly(revision))
+        self.pending = ([plotly.io.json.to_json_plotly(trace) for trace in figure["data"]], plotly.io.json.to_json_plotly(figure["layout"]))
+        if self.ready:
+            self.render()
+        elif self.url().isEmpty():
+            self.load(QUrl.fromLocalFile(QFileInfo(self.shell).absoluteFilePath()))
+
+    def shell_loaded(self, ok):
+        self.ready = ok
+        self.sent_traces = []
+        self.sent_layout = None
+        if not ok:
+            logging.error("Couldn't load the chart page %s" % self.shell)
+        elif self.pending is not None:
+            self.render()
+
+    def show_traces(self, traces):
+        # replace some of the traces that are showing, keeping the rest of the figure as it is
+        if not self.ready or self.pending is not None:
+            return
+        for i, trace in traces.items():
+            self.sent_traces[i] = plotly.io.json.to_json_plotly(pack_trace(trace))
+        changed = ['"%d":%s' % (i, self.sent_traces[i]) for i in traces]
+        self.page().runJavaScript('update({"traces":{%s}, "count":%d, "layout":null});' % (",".join(changed), len(self.sent_traces)))
+
+    def render(self):
+        traces, layout = self.pending
+        changed = ['"%d":%s' % (i, trace) for i, trace in enumerate(traces) if i >= len(self.sent_traces) or trace != self.sent_traces[i]]
+        self.page().runJavaScript('update({"traces":{%s}, "count":%d, "layout":%s});'
+                                  % (",".join(changed), len(traces), "null" if layout == self.sent_layout else layout))
+        self.sent_traces = traces
+        self.sent_layout = layout
+        self.pending = None
+
 
 # define application class
 class Plot_Bot(QMainWindow):
@@ -58,6 +1867,7 @@ class Plot_Bot(QMainWindow):
         # verify that the temp plot folder exists in this directory --> make directory if doesn't exist
         if not os.path.exists("Temp Plots"):
             os.mkdir("Temp Plots")
+        plot_shell = write_plot_shell("Temp Plots")
 
         # import app config file -- this stores locations for log files, default profiles, and file import methods
         with open("Plot_Bot.config", "r") as file:
@@ -72,6 +1882,23 @@ class Plot_Bot(QMainWindow):
             self.profiles_path = app_config["Profiles_Path"]
             if not os.path.exists(self.profiles_path):
                 os.makedirs(self.profiles_path)
+            self.cache_path = app_config.get("Cache_Path", "Cache")
+            if not os.path.exists(self.cache_path):
+                os.makedirs(self.cache_path)
+            # how often followed files are checked for new rows
+            self.follow_interval = app_config.get("Follow_Interval_Seconds", 5)
+            # time series traces longer than this are decimated, 0 turns off decimation
+            self.decimation_threshold = app_config.get("Decimation_Threshold", 100000)
+            # traces with more points than this are drawn with webgl when the render mode is auto
+            self.webgl_threshold = app_config.get("WebGL_Threshold", 50000)
+            # x-y and pair plots of more rows than this are drawn as density grids when the render mode is auto
+            self.density_threshold = app_config.get("Density_Threshold", 200000)
+            # cache size of 0 turns off caching of imported files
+            cache_size = app_config.get("Cache_Size_MB", 2048)
+            if cache_size > 0:
+                self.cache = Data_Cache(self.cache_path, cache_size)
+            else:
+                self.cache = None
 
         # create logger
         self.log_file = self.log_path + os.path.sep + datetime.now().strftime("%Y-%m-%d %H.%M.%S") + ".log"
@@ -81,6 +1908,33 @@ class Plot_Bot(QMainWindow):
         self.filenames = []
         self.path = ""
         self.data = pd.DataFrame()
+        self.files = []
+        self.method = {}
+        self.lazy_columns = []
+        self.profile = None
+        self.loader = None
+        self.follow_offsets = {}
+        self.follow_headers = {}
+        self.data_buffer = None
+        self.follow_timer = QTimer(self)
+        self.follow_timer.timeout.connect(self.follow_update)
+        self.ts_traces = []
+        self.ts_window = None
+        self.hist_cache = None
+        self.ts_zoom_timer = QTimer(self)
+        self.ts_zoom_timer.setSingleShot(True)
+        self.ts_zoom_timer.setInterval(100)
+        self.ts_zoom_timer.timeout.connect(self.ts_zoom)
+        self.file_rows = []
+        self.watch_folder = ""
+        self.watch_glob = "*.csv"
+        self.watch_method = {}
+        self.watch_pending = {}
+        self.watch_failed = set()
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.watch_check)
+        self.watch_timer = QTimer(self)
+        self.watch_timer.timeout.connect(self.watch_check)
         self.version = "2.0"
 
         # base window creation
@@ -109,6 +1963,16 @@ class Plot_Bot(QMainWindow):
         plot_action.setIconVisibleInMenu(False)
         plot_action.triggered.connect(self.update_plot)
 
+        self.follow_action = QAction("&Follow Files", self)
+        self.follow_action.setShortcut("Ctrl+F")
+        self.follow_action.setCheckable(True)
+        self.follow_action.toggled.connect(self.follow_files)
+
+        self.watch_action = QAction("&Watch Folder", self)
+        self.watch_action.setShortcut("Ctrl+W")
+        self.watch_action.setCheckable(True)
+        self.watch_action.toggled.connect(self.watch_files)
+
         export_csv_action = QAction("&Export Data to CSV", self)
         export_csv_action.setShortcut("Ctrl+E")
         export_csv_action.triggered.connect(self.export_csv)
@@ -147,6 +2011,8 @@ class Plot_Bot(QMainWindow):
 
         data_menu = menu_bar.addMenu("&Data")
         data_menu.addAction(open_file_action)
+        data_menu.addAction(self.follow_action)
+        data_menu.addAction(self.watch_action)
         data_menu.addAction(export_csv_action)
         data_menu.addAction(plot_action)
         data_menu.addAction(export_html_action)
@@ -167,6 +2033,16 @@ class Plot_Bot(QMainWindow):
         self.toolbar.addAction(plot_action)
         self.toolbar.addAction(export_html_action)
 
+        # create status bar with file load progress and cancel button
+        self.load_progress = QProgressBar()
+        self.load_progress.setMaximumWidth(300)
+        self.load_progress.setVisible(False)
+        self.cancel_load_button = QPushButton("Cancel")
+        self.cancel_load_button.clicked.connect(self.cancel_load)
+        self.cancel_load_button.setVisible(False)
+        self.statusBar().addPermanentWidget(self.load_progress)
+        self.statusBar().addPermanentWidget(self.cancel_load_button)
+
         # central widget
         wid = QWidget(self)
         self.setCentralWidget(wid)
@@ -225,6 +2101,7 @@ class Plot_Bot(QMainWindow):
         self.var_list.setDragEnabled(True)
         self.var_list.setAcceptDrops(False)
         self.var_list.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.var_list.itemPressed.connect(self.var_list_pressed)
 
         upper_grid.addWidget(path_disp_label, 0, 0, 1, 1, Qt.AlignTop)
         upper_grid.addWidget(self.path_disp, 0, 1, 1, 1)
@@ -270,6 +2147,10 @@ class Plot_Bot(QMainWindow):
         self.ts_chart_title = QLineEdit()
         self.ts_chart_title.setAlignment(Qt.AlignLeft)
 
+        ts_render_label = QLabel("Render")
+        self.ts_render_disp = QComboBox()
+        self.ts_render_disp.addItems(RENDER_MODES)
+
         y1_left_label = QLabel("Y1 Left")
         self.y1_left_disp = QListWidget()
         self.y1_left_disp.setAcceptDrops(True)
@@ -393,6 +2274,8 @@ class Plot_Bot(QMainWindow):
         self.setup_panel.currentWidget().setLayout(ts_grid)
         ts_grid.addWidget(ts_num_subplots_label, 0, 0, 1, 1, Qt.AlignRight)
         ts_grid.addWidget(self.ts_num_subplots_disp, 0, 1, 1, 1, Qt.AlignVCenter)
+        ts_grid.addWidget(ts_render_label, 0, 2, 1, 1, Qt.AlignRight)
+        ts_grid.addWidget(self.ts_render_disp, 0, 3, 1, 1, Qt.AlignVCenter)
         ts_grid.addWidget(self.clear_ts_button, 0, 4, 1, 2, Qt.AlignRight)
         ts_grid.addWidget(ts_t_label, 1, 0, 1, 1, Qt.AlignRight)
         ts_grid.addWidget(self.ts_t_disp, 1, 1, 1, 2, Qt.AlignVCenter)
@@ -474,6 +2357,10 @@ class Plot_Bot(QMainWindow):
         self.xy_trendline_disp.addItem("None")
         self.xy_trendline_disp.addItem("Least Sqaures")
 
+        xy_render_label = QLabel("Render Mode")
+        self.xy_render_disp = QComboBox()
+        self.xy_render_disp.addItems(RENDER_MODES + ["Density"])
+
         # add X-Y widgets to grid
         xy_grid = QGridLayout()
         self.setup_panel.setCurrentIndex(1)
@@ -496,6 +2383,8 @@ class Plot_Bot(QMainWindow):
         xy_grid.addWidget(self.xy_color_disp, 8, 1, 1, 2)
         xy_grid.addWidget(xy_trendline_label, 9, 0, 1, 1, Qt.AlignVCenter | Qt.AlignRight)
         xy_grid.addWidget(self.xy_trendline_disp, 9, 1, 1, 2)
+        xy_grid.addWidget(xy_render_label, 10, 0, 1, 1, Qt.AlignVCenter | Qt.AlignRight)
+        xy_grid.addWidget(self.xy_render_disp, 10, 1, 1, 2)
         
 
         # create widgets for 3D tab
@@ -630,6 +2519,10 @@ class Plot_Bot(QMainWindow):
         self.pp_color_disp = QComboBox()
         self.pp_color_disp.addItem("None")
 
+        pp_render_label = QLabel("Render Mode")
+        self.pp_render_disp = QComboBox()
+        self.pp_render_disp.addItems(DENSITY_MODES)
+
         pp_clear_button = QPushButton("Clear")
         pp_clear_button.clicked.connect(self.clear_pp_var)
 
@@ -643,6 +2536,8 @@ class Plot_Bot(QMainWindow):
         pp_grid.addWidget(self.pp_var_disp, 3, 0, 1, 1)
         pp_grid.addWidget(pp_color_label, 0, 1, 1, 1, Qt.AlignHCenter | Qt.AlignBottom)
         pp_grid.addWidget(self.pp_color_disp, 1, 1, 1, 1, Qt.AlignTop)
+        pp_grid.addWidget(pp_render_label, 0, 2, 1, 1, Qt.AlignHCenter | Qt.AlignBottom)
+        pp_grid.addWidget(self.pp_render_disp, 1, 2, 1, 1, Qt.AlignTop)
         pp_grid.addWidget(pp_clear_button, 3, 1, 1, 1, Qt.AlignBottom)
 
         # set tab to time series
@@ -667,35 +2562,36 @@ class Plot_Bot(QMainWindow):
         plot_layout.addWidget(self.plot_panel)
 
         # add html containers to each plot tab
-        self.ts_plot = QWebEngineView()
+        self.ts_plot = Plot_View(plot_shell)
+        self.ts_plot.relayout.connect(self.ts_relayout)
         self.ts_plot.page().profile().downloadRequested.connect(self.download_requested)
         ts_plot_grid = QGridLayout()
         self.plot_panel.setCurrentIndex(0)
         self.plot_panel.currentWidget().setLayout(ts_plot_grid)
         ts_plot_grid.addWidget(self.ts_plot)
 
-        self.xy_plot = QWebEngineView()
+        self.xy_plot = Plot_View(plot_shell)
         self.xy_plot.page().profile().downloadRequested.connect(self.download_requested)
         xy_plot_grid = QGridLayout()
         self.plot_panel.setCurrentIndex(1)
         self.plot_panel.currentWidget().setLayout(xy_plot_grid)
         xy_plot_grid.addWidget(self.xy_plot)
 
-        self.three_dim_plot = QWebEngineView()
+        self.three_dim_plot = Plot_View(plot_shell)
         self.three_dim_plot.page().profile().downloadRequested.connect(self.download_requested)
         three_dim_plot_grid = QGridLayout()
         self.plot_panel.setCurrentIndex(2)
         self.plot_panel.currentWidget().setLayout(three_dim_plot_grid)
         three_dim_plot_grid.addWidget(self.three_dim_plot)
 
-        self.hist_plot = QWebEngineView()
+        self.hist_plot = Plot_View(plot_shell)
         self.hist_plot.page().profile().downloadRequested.connect(self.download_requested)
         hist_plot_grid = QGridLayout()
         self.plot_panel.setCurrentIndex(3)
         self.plot_panel.currentWidget().setLayout(hist_plot_grid)
         hist_plot_grid.addWidget(self.hist_plot)
 
-        self.pp_plot = QWebEngineView()
+        self.pp_plot = Plot_View(plot_shell)
         self.pp_plot.page().profile().downloadRequested.connect(self.download_requested)
         pp_plot_grid = QGridLayout()
         self.plot_panel.setCurrentIndex(4)
@@ -712,6 +2608,16 @@ class Plot_Bot(QMainWindow):
         # show UI
         self.showMaximized()
 
+    def closeEvent(self, event):
+        # a running load has to stop before its thread is destroyed
+        if self.loader is not None:
+            self.statusBar().showMessage("Cancelling...")
+            self.loader.cancel()
+            self.loader.wait()
+        self.follow_timer.stop()
+        self.watch_timer.stop()
+        super().closeEvent(event)
+
     def center(self):
         # centers window geometry
         qr = self.frameGeometry()
@@ -719,6 +2625,106 @@ class Plot_Bot(QMainWindow):
         qr.moveCenter(cp)
         self.move(qr.topLeft())
 
+    def profile_settings(self):
+        # create lists for timeseries subplots
+        y1_l = []
+        for i in range(self.y1_left_disp.count()):
+            y1_l.append(self.y1_left_disp.item(i).text())
+
+        y1_r = []
+        for i in range(self.y1_right_disp.count()):
+            y1_r.append(self.y1_right_disp.item(i).text())
+
+        y2_l = []
+        for i in range(self.y2_left_disp.count()):
+            y2_l.append(self.y2_left_disp.item(i).text())
+
+        y2_r = []
+        for i in range(self.y2_right_disp.count()):
+            y2_r.append(self.y2_right_disp.item(i).text())
+
+        y3_l = []
+        for i in range(self.y3_left_disp.count()):
+            y3_l.append(self.y3_left_disp.item(i).text())
+
+        y3_r = []
+        for i in range(self.y3_right_disp.count()):
+            y3_r.append(self.y3_right_disp.item(i).text())
+
+        y4_l = []
+        for i in range(self.y4_left_disp.count()):
+            y4_l.append(self.y4_left_disp.item(i).text())
+
+        y4_r = []
+        for i in range(self.y4_right_disp.count()):
+            y4_r.append(self.y4_right_disp.item(i).text())
+
+        # create list for pair plot
+        pp = []
+        for i in range(self.pp_var_disp.count()):
+            pp.append(self.pp_var_disp.item(i).text())
+
+        # create dictionary for time series plotting
+        ts_d = {"Number of Subplots":self.ts_num_subplots_disp.value(),
+                "Chart Title":self.ts_chart_title.text(),
+                "Time Variable":self.ts_t_disp.currentText(),
+                "Y1 Left Variables":y1_l, "Y1 Left Log Plot":self.y1_left_log.isChecked(), "Y1 Left Axis Title":self.y1_left_ax_label.text(),
+                "Y1 Right Variables":y1_r, "Y1 Right Log Plot":self.y1_right_log.isChecked(), "Y1 Right Axis Title":self.y1_right_ax_label.text(),
+                "Y2 Left Variables":y2_l, "Y2 Left Log Plot":self.y2_left_log.isChecked(), "Y2 Left Axis Title":self.y2_left_ax_label.text(),
+                "Y2 Right Variables":y2_r, "Y2 Right Log Plot":self.y2_right_log.isChecked(), "Y2 Right Axis Title":self.y2_right_ax_label.text(),
+                "Y3 Left Variables":y3_l, "Y3 Left Log Plot":self.y3_left_log.isChecked(), "Y3 Left Axis Title":self.y3_left_ax_label.text(),
+                "Y3 Right Variables":y3_r, "Y3 Right Log Plot":self.y3_right_log.isChecked(), "Y3 Right Axis Title":self.y3_right_ax_label.text(),
+                "Y4 Left Variables":y4_l, "Y4 Left Log Plot":self.y4_left_log.isChecked(), "Y4 Left Axis Title":self.y4_left_ax_label.text(),
+                "Y4 Right Variables":y4_r, "Y4 Right Log Plot":self.y4_right_log.isChecked(), "Y4 Right Axis Title":self.y4_right_ax_label.text(),
+                "Render Mode":self.ts_render_disp.currentText()}
+
+        # create dictionary for x-y plotting
+        xy_d = {"Chart Title":self.xy_chart_title.text(),
+                "Line Style":self.xy_style_disp.currentText(),
+                "X Variable":self.xy_x_disp.currentText(),
+                "X Axis Title":self.xy_x_title.text(),
+                "X Axis Log Plot":self.xy_x_log.isChecked(),
+                "Y Variable":self.xy_y_disp.currentText(),
+                "Y Axis Title":self.xy_y_title.text(),
+                "Y Axis Log Plot":self.xy_y_log.isChecked(),
+                "Color Variable":self.xy_color_disp.currentText(),
+                "Trendline":self.xy_trendline_disp.currentText(),
+                "Render Mode":self.xy_render_disp.currentText()
+                }
+
+        # create dict for three d plotting
+        three_d = {"Chart Title":self.three_dim_chart_title.text(),
+                "X Variable":self.three_dim_x_disp.currentText(),
+                "X Axis Title":self.three_dim_x_title.text(),
+                "Y Variable":self.three_dim_y_disp.currentText(),
+                "Y Axis Title":self.three_dim_y_title.text(),
+                "Z Variable":self.three_dim_z_disp.currentText(),
+                "Z Axis Title":self.three_dim_z_title.text(),
+                "Color Variable":self.three_dim_color_disp.currentText()}
+
+        # create dict for histogram
+        hist_d = {"Chart Title":self.hist_chart_title.text(),
+                "X Variable":self.hist_x_disp.currentText(),
+                "X Axis Title":self.hist_x_title.text(),
+                "Number of Bins":self.hist_num_bins_disp.value(),
+                "Normalization":self.hist_normal_disp.currentText(),
+                "Color Variable":self.hist_color_disp.currentText(),
+                "Bin Function":self.hist_func_disp.currentText(),
+                "Y Variable":self.hist_y_disp.currentText()}
+
+        # create dict for pair plot
+        pp_d = {"Chart Title":self.pp_chart_title.text(),
+                "Variables":pp,
+                "Color Variable":self.pp_color_disp.currentText(),
+                "Render Mode":self.pp_render_disp.currentText()}
+
+        # create dictionary of all items needed
+        return {"Time Series":ts_d,
+                "X-Y":xy_d,
+                "3D":three_d,
+                "Histogram":hist_d,
+                "Pair Plot":pp_d}
+
     def save_prof(self):
         try:
             # ask user for name of the file
@@ -728,105 +2734,8 @@ class Plot_Bot(QMainWindow):
 
             # open file
             with open(self.profiles_path + os.path.sep + name + ".pbprof", "w") as f:
-
-                # create lists for timeseries subplots
-                y1_l = []
-                for i in range(self.y1_left_disp.count()):
-                    y1_l.append(self.y1_left_disp.item(i).text())
-
-                y1_r = []
-                for i in range(self.y1_right_disp.count()):
-                    y1_r.append(self.y1_right_disp.item(i).text())
-
-                y2_l = []
-                for i in range(self.y2_left_disp.count()):
-                    y2_l.append(self.y2_left_disp.item(i).text())
-
-                y2_r = []
-                for i in range(self.y2_right_disp.count()):
-                    y2_r.append(self.y2_right_disp.item(i).text())
-
-                y3_l = []
-                for i in range(self.y3_left_disp.count()):
-                    y3_l.append(self.y3_left_disp.item(i).text())
-
-                y3_r = []
-                for i in range(self.y3_right_disp.count()):
-                    y3_r.append(self.y3_right_disp.item(i).text())
-
-                y4_l = []
-                for i in range(self.y4_left_disp.count()):
-                    y4_l.append(self.y4_left_disp.item(i).text())
-
-                y4_r = []
-                for i in range(self.y4_right_disp.count()):
-                    y4_r.append(self.y4_right_disp.item(i).text())
-
-                # create list for pair plot
-                pp = []
-                for i in range(self.pp_var_disp.count()):
-                    pp.append(self.pp_var_disp.item(i).text())
-
-                # create dictionary for time series plotting
-                ts_d = {"Number of Subplots":self.ts_num_subplots_disp.value(),
-                        "Chart Title":self.ts_chart_title.text(),
-                        "Time Variable":self.ts_t_disp.currentText(),
-                        "Y1 Left Variables":y1_l, "Y1 Left Log Plot":self.y1_left_log.isChecked(), "Y1 Left Axis Title":self.y1_left_ax_label.text(),
-                        "Y1 Right Variables":y1_r, "Y1 Right Log Plot":self.y1_right_log.isChecked(), "Y1 Right Axis Title":self.y1_right_ax_label.text(),
-                        "Y2 Left Variables":y2_l, "Y2 Left Log Plot":self.y2_left_log.isChecked(), "Y2 Left Axis Title":self.y2_left_ax_label.text(),
-                        "Y2 Right Variables":y2_r, "Y2 Right Log Plot":self.y2_right_log.isChecked(), "Y2 Right Axis Title":self.y2_right_ax_label.text(),
-                        "Y3 Left Variables":y3_l, "Y3 Left Log Plot":self.y3_left_log.isChecked(), "Y3 Left Axis Title":self.y3_left_ax_label.text(),
-                        "Y3 Right Variables":y3_r, "Y3 Right Log Plot":self.y3_right_log.isChecked(), "Y3 Right Axis Title":self.y3_right_ax_label.text(),
-                        "Y4 Left Variables":y4_l, "Y4 Left Log Plot":self.y4_left_log.isChecked(), "Y4 Left Axis Title":self.y4_left_ax_label.text(),
-                        "Y4 Right Variables":y4_r, "Y4 Right Log Plot":self.y4_right_log.isChecked(), "Y4 Right Axis Title":self.y4_right_ax_label.text()}
-
-                # create dictionary for x-y plotting
-                xy_d = {"Chart Title":self.xy_chart_title.text(),
-                        "Line Style":self.xy_style_disp.currentText(),
-                        "X Variable":self.xy_x_disp.currentText(),
-                        "X Axis Title":self.xy_x_title.text(),
-                        "X Axis Log Plot":self.xy_x_log.isChecked(),
-                        "Y Variable":self.xy_y_disp.currentText(),
-                        "Y Axis Title":self.xy_y_title.text(),
-                        "Y Axis Log Plot":self.xy_y_log.isChecked(),
-                        "Color Variable":self.xy_color_disp.currentText(),
-                        "Trendline":self.xy_trendline_disp.currentText()
-                        }
-
-                # create dict for three d plotting
-                three_d = {"Chart Title":self.three_dim_chart_title.text(),
-                        "X Variable":self.three_dim_x_disp.currentText(),
-                        "X Axis Title":self.three_dim_x_title.text(),
-                        "Y Variable":self.three_dim_y_disp.currentText(),
-                        "Y Axis Title":self.three_dim_y_title.text(),
-                        "Z Variable":self.three_dim_z_disp.currentText(),
-                        "Z Axis Title":self.three_dim_z_title.text(),
-                        "Color Variable":self.three_dim_color_disp.currentText()}
-
-                # create dict for histogram
-                hist_d = {"Chart Title":self.hist_chart_title.text(),
-                        "X Variable":self.hist_x_disp.currentText(),
-                        "X Axis Title":self.hist_x_title.text(),
-                        "Number of Bins":self.hist_num_bins_disp.value(),
-                        "Normalization":self.hist_normal_disp.currentText(),
-                        "Color Variable":self.hist_color_disp.currentText(),
-                        "Bin Function":self.hist_func_disp.currentText(),
-                        "Y Variable":self.hist_y_disp.currentText()}
-
-                # create dict for pair plot
-                pp_d = {"Chart Title":self.pp_chart_title.text(),
-                        "Variables":pp,
-                        "Color Variable":self.pp_color_disp.currentText()}
-
-                # create dictionary of all items needed
-                d = {"Time Series":ts_d,
-                    "X-Y":xy_d,
-                    "3D":three_d,
-                    "Histogram":hist_d,
-                    "Pair Plot":pp_d}
-
-                # write dictionary to file
-                hjson.dump(d, f)
+                # write dictionary of chart settings to file
+                hjson.dump(self.profile_settings(), f)
 
         except Exception:
             logging.exception("Exception thrown while saving profile!")
@@ -850,6 +2759,9 @@ class Plot_Bot(QMainWindow):
             with open(file, "r") as f:
                 main_d = hjson.load(f)
 
+            # keep profile around for loading only the variables it uses
+            self.profile = main_d
+
             # write values to timeseries data
             d = main_d["Time Series"]
             self.ts_chart_title.setText(d["Chart Title"])
@@ -887,6 +2799,7 @@ class Plot_Bot(QMainWindow):
             self.y4_right_disp.addItems(d["Y4 Right Variables"])
             self.y4_right_ax_label.setText(d["Y4 Right Axis Title"])
             self.y4_right_log.setChecked(d["Y4 Right Log Plot"])
+            self.ts_render_disp.setCurrentText(d.get("Render Mode", "Auto"))
 
             # write xy items
             d = main_d["X-Y"]
@@ -900,6 +2813,7 @@ class Plot_Bot(QMainWindow):
             self.xy_y_log.setChecked(d["Y Axis Log Plot"])
             self.xy_color_disp.setCurrentText(d["Color Variable"])
             self.xy_trendline_disp.setCurrentText(d["Trendline"])
+            self.xy_render_disp.setCurrentText(d.get("Render Mode", "Auto"))
 
             # set 3d tab values
             d = main_d["3D"]
@@ -929,6 +2843,7 @@ class Plot_Bot(QMainWindow):
             self.pp_var_disp.clear()
             self.pp_var_disp.addItems(d["Variables"])
             self.pp_color_disp.setCurrentText(d["Color Variable"])
+            self.pp_render_disp.setCurrentText(d.get("Render Mode", "Auto"))
 
         except Exception:
             logging.exception("Exception thrown while saving profile!")
@@ -940,8 +2855,12 @@ class Plot_Bot(QMainWindow):
             msg.exec()
 
     def open_file(self):
+        # only one load at a time
+        if self.loader is not None:
+            return
+
         # ask user for file
-        (files, _) = QFileDialog.getOpenFileNames(filter="Text (*.csv *.txt);; Workbook (*.xls *.xlsx)", caption="Select File", directory=os.path.abspath(os.sep))
+        (files, _) = QFileDialog.getOpenFileNames(filter="Text (*.csv *.txt);; Compressed Text (*.gz *.bz2 *.xz *.zst *.zip);; Workbook (*.xls *.xlsx);; Binary (*.bin *.dat);; All Files (*)", caption="Select File", directory=os.path.abspath(os.sep))
 
         # cancel handling
         if not files:
@@ -953,61 +2872,102 @@ class Plot_Bot(QMainWindow):
         #print(files)
 
         # get header and data start rows
-        d = File_Import_Settings(self.file_imports_path)
+        d = File_Import_Settings(self.file_imports_path, self.profile is not None, files)
         d.exec()
 
         # make sure the usre actually loaded in settings
         if not d.loaded:
             return
 
-        # create list of rows between header and data start
-        if d.data_start - d.header <= 1:
-            head = d.header - 1
-        else:
-            head = range(start=d.header-1, stop=d.data_start-2)
-
-        # determine path
-        i = files[0].rfind("/")
-        self.path = files[0][0:i+1]
-
-        # get filenames
-        self.filenames = []
-        for file in files:
-            i = file.rfind("/")
-            self.filenames.append(file[i+1:])
-
-        # show path
-        self.path_disp.setText(self.path)
-
-        # show filenames in the proper field
-        self.files_disp.clear()
-        self.files_disp.addItems(self.filenames)
-
-        # set date/time parser for loading data
-        if d.datetime_format.lower() == "iso":
-            date_format = True
-            date_parser = dateutil.parser.isoparse
-        else: # unix epoch
-            date_format = False
-            date_parser = None
+        # files that don't fit the file import method are left out
+        files = d.files
 
-        # concatenate dataframes
-        self.data = pd.DataFrame()
-        import_success = True
-        for file in files:
-            # load in file, with error handling
+        # only parse the profile variables, the rest of the columns are loaded when used
+        method = d.method
+        lazy_columns = []
+        if d.profile_only:
             try:
-                # determine whether it is a txt file or speadsheet
-                if d.file_type.lower() == "text":
-                    data = pd.read_csv(file, header=head, sep=d.delim, skip_blank_lines=False, infer_datetime_format=date_format, date_parser=date_parser)
-                elif d.file_type.lower() == "spreadsheet":
-                    data = pd.read_excel(file, sheet_name=d.sheet, header=head)
-                # concat data
-                self.data = pd.concat([self.data, data])
+                header = read_header(files[0], method)
+                method = project_method(method, header, profile_variables(self.profile))
+                lazy_columns = [col for col in header if col not in method["Use_Columns"]]
             except Exception:
-                logging.exception("Exception thrown while loading in file(s)!")
-                import_success = False
-        
+                logging.exception("Exception thrown while reading header of %s!" % files[0])
+
+        # stop following the old files
+        self.follow_action.setChecked(False)
+
+        # stop watching the old folder
+        self.watch_action.setChecked(False)
+
+        # load in files on a background thread, the data is swapped in once they are all parsed
+        self.start_loader(files, method, self.load_finished)
+        self.loader.lazy_columns = lazy_columns
+
+    def start_loader(self, files, method, finished):
+        # start loading files in the background, calling finished(data, import_success) when done
+        self.loader = File_Loader(files, method, self.cache)
+        self.loader.progress.connect(self.load_progress_changed)
+        self.loader.loaded.connect(finished)
+        self.load_progress.setRange(0, 1000)
+        self.load_progress.setValue(0)
+        self.load_progress.setFormat("%%p%% (0/%d files)" % len(files))
+        self.load_progress.setVisible(True)
+        self.cancel_load_button.setEnabled(True)
+        self.cancel_load_button.setVisible(True)
+        self.statusBar().showMessage("Loading files...")
+        self.loader.start()
+
+    def load_progress_changed(self, files_done, files_total, value, maximum):
+        self.load_progress.setMaximum(maximum)
+        self.load_progress.setValue(value)
+        self.load_progress.setFormat("%%p%% (%d/%d files)" % (files_done, files_total))
+
+    def cancel_load(self):
+        if self.loader is not None:
+            self.cancel_load_button.setEnabled(False)
+            self.statusBar().showMessage("Cancelling...")
+            self.loader.cancel()
+
+    def load_finished(self, data, import_success):
+        loader = self.loader
+        files = loader.files
+        loader.wait()
+        self.loader = None
+        self.load_progress.setVisible(False)
+        self.cancel_load_button.setVisible(False)
+
+        # cancelled or failed loads keep the current data
+        if data is None:
+            self.statusBar().showMessage("File load cancelled" if import_success else "File load failed", 5000)
+        else:
+            # determine path
+            i = files[0].rfind("/")
+            self.path = files[0][0:i+1]
+
+            # get filenames
+            self.filenames = []
+            for file in files:
+                i = file.rfind("/")
+                self.filenames.append(file[i+1:])
+
+            # show path
+            self.path_disp.setText(self.path)
+
+            # show filenames in the proper field
+            self.files_disp.clear()
+            self.files_disp.addItems(self.filenames)
+
+            # swap in the new data
+            self.data = data
+            self.files = files
+            self.file_rows = data.attrs.get("Files", [])
+            self.method = loader.method
+            self.lazy_columns = [col for col in loader.lazy_columns if col not in self.data.columns]
+            message = "Loaded %d rows from %d files, %.1f MB in memory" % (len(self.data), len(files), self.data.memory_usage(deep=True).sum() / 1e6)
+            if self.data.attrs.get("Bytes_Saved", 0) > 0:
+                message += " (%.1f MB saved by compaction)" % (self.data.attrs["Bytes_Saved"] / 1e6)
+            self.statusBar().showMessage(message, 10000)
+
         if not import_success:
             msg = QMessageBox()
             msg.setWindowTitle("Something Went Wrong")
@@ -1017,18 +2977,254 @@ class Plot_Bot(QMainWindow):
             msg.exec()
 
         # update combo & list boxes
-        if not self.data.empty:
+        if data is not None and not self.data.empty:
             self.update_variable_holders()
 
+    def follow_files(self, checked):
+        # start or stop following the loaded files for newly written rows
+        if not checked:
+            self.follow_timer.stop()
+            self.data_buffer = None
+            self.statusBar().showMessage("Stopped following files", 5000)
+            return
+
+        if (self.data.empty or self.method.get("File_Type", "").lower() != "text" or self.method.get("Import_Mode", "Standard") != "Standard"
+                or self.method.get("Row_Window", None) or any(file_compression(file) is not None for file in self.files)):
+            self.follow_action.setChecked(False)
+            msg = QMessageBox()
+            msg.setWindowTitle("Can't Follow Files")
+            msg.setIcon(QMessageBox.Warning)
+            msg.setText("Uh oh!")
+            msg.setInformativeText("Only uncompressed text files loaded with the standard import mode and no row window can be followed.")
+            msg.exec()
+            return
+
+        try:
+            # remember where the complete lines of each file end
+            self.follow_offsets = {}
+            self.follow_headers = {}
+            for file in self.files:
+                self.follow_offsets[file] = complete_line_offset(file)
+                self.follow_headers[file] = read_header(file, self.method)
+
+            # a partly written last line was parsed with its file, it gets read again once complete
+            # files are in order unless they were merged by time, then the row is found by its values
+            drop = []
+            start = 0
+            for file_rows in self.file_rows:
+                file, rows = file_rows
+                if rows > 0 and file in self.follow_offsets and os.path.getsize(file) > self.follow_offsets[file]:
+                    if self.method.get("Merge_By_Time", False):
+                        i = partial_row(file, self.follow_offsets[file], self.follow_headers[file], self.data, self.method)
+                    else:
+                        i = start + rows - 1
+                    if i is not None:
+                        drop.append(i)
+                        file_rows[1] -= 1
+                start += rows
+            if drop:
+                keep = np.ones(len(self.data), dtype=bool)
+                keep[drop] = False
+                self.data = self.data[keep].reset_index(drop=True)
+
+            # move the data into buffers that can be appended to
+            self.data_buffer = Data_Buffer(self.data)
+            self.data = self.data_buffer.frame()
+        except Exception:
+            logging.exception("Exception thrown while starting to follow files!")
+            self.follow_action.setChecked(False)
+            return
+
+        self.follow_timer.start(int(self.follow_interval * 1000))
+        self.statusBar().showMessage("Following %d files" % len(self.files), 5000)
+
+    def follow_update(self):
+        # append rows written to the followed files since the last check
+        try:
+            # data was replaced (math channels, unit conversions) or given new columns (lazy loads),
+            # start buffering the new data
+            if self.data is not self.data_buffer.last_frame or list(self.data.columns) != self.data_buffer.columns:
+                self.data_buffer = Data_Buffer(self.data)
+
+            rows = 0
+            for file in list(self.follow_offsets):
+                size = os.path.getsize(file)
+                if size < self.follow_offsets[file]:
+                    logging.warning("%s got smaller, it is no longer followed" % file)
+                    self.follow_offsets[file] = size
+                if size == self.follow_offsets[file]:
+                    continue
+                data, self.follow_offsets[file] = read_new_rows(file, self.follow_offsets[file], self.follow_headers[file], self.method)
+                if data is not None:
+                    self.data_buffer.append(data)
+                    rows += len(data)
+                    for file_rows in self.file_rows:
+                        if file_rows[0] == file:
+                            file_rows[1] += len(data)
+            if rows == 0:
+                return
+            self.data = self.data_buffer.frame()
+            self.statusBar().showMessage("Appended %d rows, %d rows total" % (rows, len(self.data)), 5000)
+            self.refresh_active_plot()
+        except Exception:
+            logging.exception("Exception thrown while following files!")
+            self.follow_action.setChecked(False)
+
+    def refresh_active_plot(self):
+        # redraw the chart that is showing, if one has been drawn
+        view = [self.ts_plot, self.xy_plot, self.three_dim_plot, self.hist_plot, self.pp_plot][self.plot_panel.currentIndex()]
+        if view.figure is not None:
+            self.update_plot()
+
+    def watch_files(self, checked):
+        # start or stop watching a folder for new data files
+        if not checked:
+            self.watcher.removePaths(self.watcher.directories())
+            self.watch_timer.stop()
+            self.watch_pending = {}
+            self.statusBar().showMessage("Stopped watching %s" % self.watch_folder, 5000)
+            return
+
+        # ask user for folder, file pattern and import method
+        folder = QFileDialog.getExistingDirectory(caption="Select Folder To Watch", directory=self.path or os.path.abspath(os.sep))
+        if folder == "":
+            self.watch_action.setChecked(False)
+            return
+        pattern, ok = QInputDialog.getText(self, "File Pattern", "Load files matching", text=self.watch_glob)
+        if not ok or pattern == "":
+            self.watch_action.setChecked(False)
+            return
+        d = File_Import_Settings(self.file_imports_path)
+        d.exec()
+        if not d.loaded:
+            self.watch_action.setChecked(False)
+            return
+
+        self.watch_folder = folder
+        self.watch_glob = pattern
+        self.watch_method = d.method
+        self.watch_pending = {}
+        self.watch_failed = set()
+
+        # fall back on polling when the folder can't be watched (network drives and the like)
+        if not self.watcher.addPath(folder):
+            logging.warning("Can't watch %s, polling it instead" % folder)
+            self.watch_timer.start(int(self.follow_interval * 1000))
+        self.statusBar().showMessage("Watching %s for %s" % (folder, pattern), 5000)
+        self.watch_check()
+
+    def watch_check(self):
+        # look for new files in the watched folder, loading them once they stop growing
+        if not self.watch_action.isChecked():
+            return
+        if self.loader is not None:
+            QTimer.singleShot(int(self.follow_interval * 1000), self.watch_check)
+            return
+
+        known = set(os.path.normpath(file) for file in self.files) | self.watch_failed
+        ready = []
+        for file in glob.glob(os.path.join(self.watch_folder, self.watch_glob)):
+            file = os.path.normpath(file)
+            if file in known or not os.path.isfile(file):
+                continue
+            # a file is ready once its size hasn't changed for a whole follow interval,
+            # change notifications can come milliseconds apart while a file is still being written
+            size = os.path.getsize(file)
+            now = time.monotonic()
+            if file in self.watch_pending and self.watch_pending[file][0] == size:
+                if now - self.watch_pending[file][1] >= self.follow_interval:
+                    ready.append(file)
+                    del self.watch_pending[file]
+            else:
+                self.watch_pending[file] = (size, now)
+
+        # check back on files that are still being written
+        if self.watch_pending and not self.watch_timer.isActive():
+            QTimer.singleShot(int(self.follow_interval * 1000), self.watch_check)
+
+        if ready:
+            ready.sort(key=os.path.getctime)
+            self.start_loader(ready, self.watch_method, self.watch_loaded)
+
+    def watch_loaded(self, data, import_success):
+        loader = self.loader
+        loader.wait()
+        self.loader = None
+        self.load_progress.setVisible(False)
+        self.cancel_load_button.setVisible(False)
+
+        # files that fail to parse aren't tried again
+        loaded = [file for file, _ in data.attrs.get("Files", [])] if data is not None else []
+        self.watch_failed.update(file for file in loader.files if file not in loaded)
+        if data is None or data.empty:
+            return
+
+        try:
+            if self.watch_method.get("Merge_By_Time", False):
+                # merged data isn't grouped by file, so the new rows are merged in by time
+                file_rows = self.file_rows + data.attrs["Files"]
+                self.data = merge_frames([self.data, data], self.watch_method)
+            else:
+                # split the new rows back up by file
+                new_frames = []
+                start = 0
+                for file, rows in data.attrs["Files"]:
+                    new_frames.append((os.path.getctime(file), file, rows, data.iloc[start:start+rows]))
+                    start += rows
+
+                # fit each new file in between the loaded files by creation time
+                frames = []
+                file_rows = []
+                start = 0
+                for file, rows in self.file_rows:
+                    ctime = os.path.getctime(file) if os.path.exists(file) else 0
+                    while new_frames and new_frames[0][0] < ctime:
+                        _, new_file, new_rows, new_data = new_frames.pop(0)
+                        frames.append(new_data)
+                        file_rows.append([new_file, new_rows])
+                    frames.append(self.data.iloc[start:start+rows])
+                    file_rows.append([file, rows])
+                    start += rows
+                # rows that aren't tied to a file (e.g. appended while following) stay where they are
+                if start < len(self.data):
+                    frames.append(self.data.iloc[start:])
+                for _, new_file, new_rows, new_data in new_frames:
+                    frames.append(new_data)
+                    file_rows.append([new_file, new_rows])
+
+                # merge with a single concat
+                self.data = combine_frames(frames)
+            self.file_rows = file_rows
+            self.files = [file for file, _ in file_rows]
+            self.method = self.method or self.watch_method
+            self.data.attrs["Files"] = file_rows
+        except Exception:
+            logging.exception("Exception thrown while merging watched files!")
+            return
+
+        # show the new files
+        self.filenames = [os.path.basename(file) for file in self.files]
+        self.files_disp.clear()
+        self.files_disp.addItems(self.filenames)
+        self.statusBar().showMessage("Added %d new files, %d rows total" % (len(loader.files), len(self.data)), 5000)
+        self.update_variable_holders()
+        self.refresh_active_plot()
+
     def update_variable_holders(self):
-        # var list widget
+        # loaded columns first, followed by columns that will be loaded when used
+        columns = list(self.data.columns) + self.lazy_columns
+
+        # var list widget, greying out columns that aren't loaded yet
         self.var_list.clear()
-        self.var_list.addItems(self.data.columns)
+        self.var_list.addItems(columns)
+        for i in range(len(self.data.columns), len(columns)):
+            self.var_list.item(i).setForeground(Qt.gray)
+            self.var_list.item(i).setToolTip("Not loaded yet, loads when used")
         # time series time box, trying to save what was last in there
         str = self.ts_t_disp.currentText()
         self.ts_t_disp.clear()
         self.ts_t_disp.addItem("")
-        self.ts_t_disp.addItems(self.data.columns)
+        self.ts_t_disp.addItems(columns)
         loc = self.ts_t_disp.findText(str)
         if not loc == -1:
             self.ts_t_disp.setCurrentIndex(loc)
@@ -1036,7 +3232,7 @@ class Plot_Bot(QMainWindow):
         str = self.xy_x_disp.currentText()
         self.xy_x_disp.clear()
         self.xy_x_disp.addItem("")
-        self.xy_x_disp.addItems(self.data.columns)
+        self.xy_x_disp.addItems(columns)
         loc = self.xy_x_disp.findText(str)
         if not loc == -1:
             self.xy_x_disp.setCurrentIndex(loc)
@@ -1044,7 +3240,7 @@ class Plot_Bot(QMainWindow):
         str = self.xy_y_disp.currentText()
         self.xy_y_disp.clear()
         self.xy_y_disp.addItem("")
-        self.xy_y_disp.addItems(self.data.columns)
+        self.xy_y_disp.addItems(columns)
         loc = self.xy_y_disp.findText(str)
         if not loc == -1:
             self.xy_y_disp.setCurrentIndex(loc)
@@ -1052,7 +3248,7 @@ class Plot_Bot(QMainWindow):
         str = self.xy_color_disp.currentText()
         self.xy_color_disp.clear()
         self.xy_color_disp.addItem("None")
-        self.xy_color_disp.addItems(self.data.columns)
+        self.xy_color_disp.addItems(columns)
         loc = self.xy_color_disp.findText(str)
         if not loc == -1:
             self.xy_color_disp.setCurrentIndex(loc)
@@ -1061,7 +3257,7 @@ class Plot_Bot(QMainWindow):
         str = self.three_dim_x_disp.currentText()
         self.three_dim_x_disp.clear()
         self.three_dim_x_disp.addItem("")
-        self.three_dim_x_disp.addItems(self.data.columns)
+        self.three_dim_x_disp.addItems(columns)
         loc = self.three_dim_x_disp.findText(str)
         if not loc == -1:
             self.three_dim_x_disp.setCurrentIndex(loc)
@@ -1069,7 +3265,7 @@ class Plot_Bot(QMainWindow):
         str = self.three_dim_y_disp.currentText()
         self.three_dim_y_disp.clear()
         self.three_dim_y_disp.addItem("")
-        self.three_dim_y_disp.addItems(self.data.columns)
+        self.three_dim_y_disp.addItems(columns)
         loc = self.three_dim_y_disp.findText(str)
         if not loc == -1:
             self.three_dim_y_disp.setCurrentIndex(loc)
@@ -1077,7 +3273,7 @@ class Plot_Bot(QMainWindow):
         str = self.three_dim_z_disp.currentText()
         self.three_dim_z_disp.clear()
         self.three_dim_z_disp.addItem("")
-        self.three_dim_z_disp.addItems(self.data.columns)
+        self.three_dim_z_disp.addItems(columns)
         loc = self.three_dim_z_disp.findText(str)
         if not loc == -1:
             self.three_dim_z_disp.setCurrentIndex(loc)
@@ -1085,7 +3281,7 @@ class Plot_Bot(QMainWindow):
         str = self.three_dim_color_disp.currentText()
         self.three_dim_color_disp.clear()
         self.three_dim_color_disp.addItem("None")
-        self.three_dim_color_disp.addItems(self.data.columns)
+        self.three_dim_color_disp.addItems(columns)
         loc = self.three_dim_color_disp.findText(str)
         if not loc == -1:
             self.three_dim_color_disp.setCurrentIndex(loc)
@@ -1094,7 +3290,7 @@ class Plot_Bot(QMainWindow):
         str = self.hist_x_disp.currentText()
         self.hist_x_disp.clear()
         self.hist_x_disp.addItem("")
-        self.hist_x_disp.addItems(self.data.columns)
+        self.hist_x_disp.addItems(columns)
         loc = self.hist_x_disp.findText(str)
         if not loc == -1:
             self.hist_x_disp.setCurrentIndex(loc)
@@ -1102,7 +3298,7 @@ class Plot_Bot(QMainWindow):
         str = self.hist_y_disp.currentText() 
         self.hist_y_disp.clear()
         self.hist_y_disp.addItem("")
-        self.hist_y_disp.addItems(self.data.columns)
+        self.hist_y_disp.addItems(columns)
         loc = self.hist_y_disp.findText(str)
         if not loc == -1:
             self.hist_y_disp.setCurrentIndex(loc)
@@ -1110,7 +3306,7 @@ class Plot_Bot(QMainWindow):
         str = self.hist_color_disp.currentText()
         self.hist_color_disp.clear()
         self.hist_color_disp.addItem("None")
-        self.hist_color_disp.addItems(self.data.columns)
+        self.hist_color_disp.addItems(columns)
         loc = self.hist_color_disp.findText(str)
         if not loc == -1:
             self.hist_color_disp.setCurrentIndex(loc)
@@ -1119,13 +3315,121 @@ class Plot_Bot(QMainWindow):
         str = self.pp_color_disp.currentText()
         self.pp_color_disp.clear()
         self.pp_color_disp.addItem("None")
-        self.pp_color_disp.addItems(self.data.columns)
+        self.pp_color_disp.addItems(columns)
         loc = self.pp_color_disp.findText(str)
         if not loc == -1:
             self.pp_color_disp.setCurrentIndex(loc)
 
+    def var_list_pressed(self, item: QListWidgetItem):
+        # load a variable the first time it is picked from the list
+        if item.text() in self.lazy_columns:
+            self.load_lazy_columns([item.text()])
+
+    def load_lazy_columns(self, names, finished=None):
+        # load columns that were left out of a projected load on the loader thread, re-reading only those columns
+        # returns true if a load was started, finished is called once the columns are in
+        names = [name for name in names if name in self.lazy_columns]
+        if not names or self.loader is not None:
+            return False
+        method = dict(self.method)
+        # the time column comes along so the time window, merging and duplicate dropping pick the same rows as the main load
+        time_column = window_time_column(self.data.columns, method)
+        extra = method.get("Datetime_Columns", []) + ([time_column] if time_column is not None else [])
+        method["Use_Columns"] = names + [name for name in extra if name not in names]
+        self.start_loader(self.files, method, self.lazy_loaded)
+        self.statusBar().showMessage("Loading %s..." % ", ".join(names))
+        self.loader.lazy_columns = names
+        self.loader.target = self.data
+        self.loader.then = finished
+        return True
+
+    def lazy_loaded(self, data, import_success):
+        loader = self.loader
+        loader.wait()
+        self.loader = None
+        self.load_progress.setVisible(False)
+        self.cancel_load_button.setVisible(False)
+        self.statusBar().clearMessage()
+
+        # the columns only fit the data they were loaded for
+        names = loader.lazy_columns
+        if data is not None:
+            for name in names:
+                if loader.target is self.data and name in data.columns and len(data) == len(self.data):
+                    self.data[name] = data[name].to_numpy()
+                    self.lazy_columns.remove(name)
+                    self.hist_cache = None
+                else:
+                    logging.error("Could not load %s, the rows don't line up with the loaded data" % name)
+                    import_success = False
+
+        if not import_success:
+            msg = QMessageBox()
+            msg.setWindowTitle("Something Went Wrong")
+            msg.setIcon(QMessageBox.Critical)
+            msg.setText("Uh oh!")
+            msg.setInformativeText("Looks like something went wrong loading %s. Please check %s" % (", ".join(names), self.log_file))
+            msg.exec()
+
+        # show newly loaded variables
+        for i in range(self.var_list.count()):
+            if self.var_list.item(i).text() in names and self.var_list.item(i).text() not in self.lazy_columns:
+                self.var_list.item(i).setForeground(self.var_list.palette().text())
+                self.var_list.item(i).setToolTip("")
+
+        # carry on with whatever needed the columns
+        if data is not None and import_success and loader.then is not None:
+            loader.then()
+
+    def ts_bins(self):
+        # pixel columns of the time series chart, the point budget of each trace is four points per column
+        return max(self.ts_plot.width(), 500)
+
+    def ts_trace(self, t_var, y_var, window=None, zoom=False):
+        # time series line, decimated when it has more points than the chart can show
+        # with a window only the rows inside it are used, so zooming in shows more detail
+        # zoom traces replace ones already drawn, so they aren't added to the list of drawn traces
+        rows = window_slice(self.data[t_var], window)
+        x, y, decimated = decimate_line(self.data[t_var].iloc[rows], self.data[y_var].iloc[rows], self.decimation_threshold, self.ts_bins())
+        if not zoom:
+            self.ts_traces.append((t_var, y_var))
+            self.ts_decimated = self.ts_decimated or decimated
+        if use_webgl(self.ts_render_disp.currentText(), len(x), self.webgl_threshold):
+            return go.Scattergl(x=x, y=y, mode="lines", name=y_var)
+        return go.Scatter(x=x, y=y, mode="lines", name=y_var)
+
+    def ts_relayout(self, event):
+        # zoomed or panned the time series chart, wait for the user to settle before refreshing
+        changed, window = relayout_x_range(event)
+        if changed:
+            self.ts_window = window
+            self.ts_zoom_timer.start()
+
+    def ts_zoom(self):
+        # redo the decimation for the part of the time series that is showing
+        try:
+            if not self.ts_traces or not self.ts_decimated:
+                return
+            # keep each trace's axes and style, only the points change
+            traces = {}
+            for i, (t_var, y_var) in enumerate(self.ts_traces):
+                if t_var in self.data.columns and y_var in self.data.columns:
+                    detail = self.ts_trace(t_var, y_var, self.ts_window, zoom=True)
+                    traces[i] = self.ts_plot.figure.data[i].to_plotly_json()
+                    traces[i].update(type=detail.type, x=detail.x, y=detail.y)
+            self.ts_plot.show_traces(traces)
+        except Exception:
+            logging.exception("Exception thrown while zooming time series chart!")
+
     def update_plot(self):
         try:
+            # make sure any variables used by the charts are loaded, the chart is drawn once they are
+            needed = [name for name in profile_variables(self.profile_settings()) if name in self.lazy_columns]
+            if needed:
+                if not self.load_lazy_columns(needed, self.update_plot):
+                    self.statusBar().showMessage("Still loading, try again once the load is done", 5000)
+                return
+
             # determine what plot is active
             if self.plot_panel.tabText(self.plot_panel.currentIndex()) == "&Time Series":
                 # check that time and at least y1 are populated with variables
@@ -1149,6 +3453,9 @@ class Plot_Bot(QMainWindow):
 
                     # create subplots
                     fig = make_subplots(rows=n_sub, cols=1, shared_xaxes=True, specs=spec)
+                    self.ts_decimated = False
+                    previous_traces = self.ts_traces
+                    self.ts_traces = []
 
                     # populate the first
                     if n_sub >= 1:
@@ -1156,15 +3463,13 @@ class Plot_Bot(QMainWindow):
                         if self.y1_left_disp.count() > 0:
                             for i in range(0, self.y1_left_disp.count()):
                                 y_var = self.y1_left_disp.item(i).text()
-                                fig.add_trace(go.Scatter(x=self.data[t_var], y=self.data[y_var],
-                                                         mode='lines', name=y_var), secondary_y=False, row=1, col=1)
+                                fig.add_trace(self.ts_trace(t_var, y_var), secondary_y=False, row=1, col=1)
 
                         # populate right axis
                         if self.y1_right_disp.count() > 0:
                             for i in range(0, self.y1_right_disp.count()):
                                 y_var = self.y1_right_disp.item(i).text()
-                                fig.add_trace(go.Scatter(x=self.data[t_var], y=self.data[y_var],
-                                                        mode='lines', name=y_var), secondary_y=True, row=1, col=1)
+                                fig.add_trace(self.ts_trace(t_var, y_var), secondary_y=True, row=1, col=1)
 
                         # update layout
                         fig.update_layout(template='simple_white')
@@ -1200,15 +3505,13 @@ class Plot_Bot(QMainWindow):
                         if self.y2_left_disp.count() > 0:
                             for i in range(0, self.y2_left_disp.count()):
                                 y_var = self.y2_left_disp.item(i).text()
-                                fig.add_trace(go.Scatter(x=self.data[t_var], y=self.data[y_var],
-                                                         mode='lines', name=y_var), secondary_y=False, row=2, col=1)
+                                fig.add_trace(self.ts_trace(t_var, y_var), secondary_y=False, row=2, col=1)
 
                         # populate right axis
                         if self.y2_right_disp.count() > 0:
                             for i in range(0, self.y2_right_disp.count()):
                                 y_var = self.y2_right_disp.item(i).text()
-                                fig.add_trace(go.Scatter(x=self.data[t_var], y=self.data[y_var],
-                                                         mode='lines', name=y_var), secondary_y=True, row=2, col=1)
+                                fig.add_trace(self.ts_trace(t_var, y_var), secondary_y=True, row=2, col=1)
 
                         # update layout
                         fig.update_layout(template='simple_white')
@@ -1244,15 +3547,13 @@ class Plot_Bot(QMainWindow):
                         if self.y3_left_disp.count() > 0:
                             for i in range(0, self.y3_left_disp.count()):
                                 y_var = self.y3_left_disp.item(i).text()
-                                fig.add_trace(go.Scatter(x=self.data[t_var], y=self.data[y_var],
-                                                         mode='lines', name=y_var), secondary_y=False, row=3, col=1)
+                                fig.add_trace(self.ts_trace(t_var, y_var), secondary_y=False, row=3, col=1)
 
                         # populate right axis
                         if self.y3_right_disp.count() > 0:
                             for i in range(0, self.y3_right_disp.count()):
                                 y_var = self.y3_right_disp.item(i).text()
-                                fig.add_trace(go.Scatter(x=self.data[t_var], y=self.data[y_var],
-                                                         mode='lines', name=y_var), secondary_y=True, row=3, col=1)
+                                fig.add_trace(self.ts_trace(t_var, y_var), secondary_y=True, row=3, col=1)
 
                         # update layout
                         fig.update_layout(template='simple_white')
@@ -1288,15 +3589,13 @@ class Plot_Bot(QMainWindow):
                         if self.y4_left_disp.count() > 0:
                             for i in range(0, self.y4_left_disp.count()):
                                 y_var = self.y4_left_disp.item(i).text()
-                                fig.add_trace(go.Scatter(x=self.data[t_var], y=self.data[y_var],
-                                                         mode='lines', name=y_var), secondary_y=False, row=4, col=1)
+                                fig.add_trace(self.ts_trace(t_var, y_var), secondary_y=False, row=4, col=1)
 
                         # populate right axis
                         if self.y4_right_disp.count() > 0:
                             for i in range(0, self.y4_right_disp.count()):
                                 y_var = self.y4_right_disp.item(i).text()
-                                fig.add_trace(go.Scatter(x=self.data[t_var], y=self.data[y_var],
-                                                         mode='lines', name=y_var), secondary_y=True, row=4, col=1)
+                                fig.add_trace(self.ts_trace(t_var, y_var), secondary_y=True, row=4, col=1)
 
                         # update layout
                         fig.update_layout(template='simple_white')
@@ -1332,12 +3631,20 @@ class Plot_Bot(QMainWindow):
                     # update title
                     fig.update_layout(title_text=chart_title, title_x=0.5)
 
-                    # put into html code
-                    plotly.offline.plot(fig, filename="Temp Plots" + os.path.sep + "ts_temp.html",
-                                        include_plotlyjs=True, auto_open=False)
+                    # let the user know the chart isn't showing every point
+                    if self.ts_decimated:
+                        fig.add_annotation(text="Decimated to %d px, peaks kept" % self.ts_bins(), xref="paper", yref="paper",
+                                           x=1, y=1, xanchor="right", yanchor="bottom", showarrow=False,
+                                           font=dict(size=10, color="Gray"))
+
+                    # draw the chart, plotly.js is already loaded in the view
+                    self.ts_plot.show_figure(fig)
 
-                    # add to pair plot tab
-                    self.ts_plot.load(QUrl.fromLocalFile(QFileInfo("Temp Plots" + os.path.sep + "ts_temp.html").absoluteFilePath()))
+                    # the zoom is kept when the same traces are drawn, so show the detail for it again
+                    if self.ts_traces == previous_traces and self.ts_window is not None:
+                        self.ts_zoom()
+                    else:
+                        self.ts_window = None
 
                 else:
                     msg = QMessageBox()
@@ -1399,16 +3706,33 @@ class Plot_Bot(QMainWindow):
                     else:
                         trend = None
                     
-                    # build figure depending on scatter vs line
-                    if self.xy_style_disp.currentText() == "Scatter":
+                    # svg or webgl depending on the render mode and number of points
+                    mode = self.xy_render_disp.currentText()
+                    if use_webgl(mode, len(self.data), self.webgl_threshold):
+                        render = "webgl"
+                    else:
+                        render = "svg"
+
+                    # build figure as a density grid for large data, otherwise depending on scatter vs line
+                    if mode == "Density" or (mode == "Auto" and len(self.data) > self.density_threshold):
+                        x_axis = grid_axis(self.data[x_var], 300, log_x)
+                        y_axis = grid_axis(self.data[y_var], 300, log_y)
+                        x_edges, y_edges, z, z_title = density_grid(x_axis, y_axis, None if color is None else self.data[color])
+                        fig = go.Figure(go.Heatmap(x=x_edges, y=y_edges, z=z, colorscale="Viridis", hoverongaps=False,
+                                                   colorbar_title_text=z_title))
+                        fig.update_layout(template="simple_white")
+                        fig.update_xaxes(title_text=x_title, type="log" if log_x else None)
+                        fig.update_yaxes(title_text=y_title, type="log" if log_y else None)
+
+                    elif self.xy_style_disp.currentText() == "Scatter":
                         fig = px.scatter(self.data, x=x_var, y=y_var, trendline=trend,
                                             color=color, log_x=log_x, log_y=log_y, template="simple_white",
-                                            labels={x_var: x_title, y_var: y_title})
+                                            labels={x_var: x_title, y_var: y_title}, render_mode=render)
 
                     else:
                         fig = px.line(self.data, x=x_var, y=y_var, color=color, template="simple_white",
                                       log_x=log_x, log_y=log_y,
-                                      labels={x_var: x_title, y_var: y_title})
+                                      labels={x_var: x_title, y_var: y_title}, render_mode=render)
 
                     # update grid lines
                     fig.update_xaxes(showgrid=True, gridcolor="LightGray")
@@ -1417,13 +3741,8 @@ class Plot_Bot(QMainWindow):
                     # update title
                     fig.update_layout(title_text=chart_title, title_x=0.5)
 
-                    # put into html code
-                    plotly.offline.plot(fig, filename="Temp Plots" + os.path.sep + "xy_temp.html",
-                                        include_plotlyjs=True, auto_open=False)
-
-                    # add to pair plot tab
-                    self.xy_plot.load(
-                        QUrl.fromLocalFile(QFileInfo("Temp Plots" + os.path.sep + "xy_temp.html").absoluteFilePath()))
+                    # draw the chart, plotly.js is already loaded in the view
+                    self.xy_plot.show_figure(fig)
 
                 else:
                     msg = QMessageBox()
@@ -1481,13 +3800,8 @@ class Plot_Bot(QMainWindow):
                     fig.update_traces(marker_size=2.5, selector=dict(type='scatter3d'))
                     fig.update_layout(title_text=chart_title, title_x=0.5, title_y=0.92)
 
-                    # put into html code
-                    plotly.offline.plot(fig, filename="Temp Plots" + os.path.sep + "3d_temp.html",
-                                        include_plotlyjs=True, auto_open=False)
-
-                    # add to pair plot tab
-                    self.three_dim_plot.load(
-                        QUrl.fromLocalFile(QFileInfo("Temp Plots" + os.path.sep + "3d_temp.html").absoluteFilePath()))
+                    # draw the chart, plotly.js is already loaded in the view
+                    self.three_dim_plot.show_figure(fig)
 
                 else:
                     msg = QMessageBox()
@@ -1542,21 +3856,35 @@ class Plot_Bot(QMainWindow):
                     else:
                         y_var = self.hist_y_disp.currentText()
 
-                    # build figure
-                    fig = px.histogram(self.data, x=x_var, y=y_var, nbins=n, histnorm=norm,
-                                       histfunc=bin_func, color=color, template="simple_white",
-                                       labels={x_var:x_title})
-                    fig.update_xaxes(showgrid=True, gridcolor="LightGray")
-                    fig.update_yaxes(showgrid=True, gridcolor="LightGray")
+                    # bin the data, the bins are reused while only titles change
+                    key = (len(self.data), x_var, y_var, color, n, norm, bin_func)
+                    if self.hist_cache is None or self.hist_cache[0]() is not self.data or self.hist_cache[1] != key:
+                        bins = histogram_bins(self.data[x_var], None if y_var is None else self.data[y_var],
+                                              None if color is None else self.data[color], n, bin_func, norm)
+                        self.hist_cache = (weakref.ref(self.data), key, bins)
+                    names, centers, widths, heights = self.hist_cache[2]
+
+                    # y title like plotly's histogram
+                    if y_var is None:
+                        y_title = "count"
+                    else:
+                        y_title = "%s of %s" % (bin_func, y_var)
+                    if norm is not None:
+                        y_title = "%s of %s" % (norm, y_title) if y_var is not None else norm
+
+                    # build figure, one bar trace per color group
+                    fig = go.Figure()
+                    colors = px.colors.qualitative.Plotly
+                    for i, name in enumerate(names):
+                        fig.add_trace(go.Bar(x=centers, y=heights[i], width=widths, name=name, showlegend=color is not None,
+                                             marker_color=colors[i % len(colors)]))
+                    fig.update_layout(template="simple_white", barmode="relative", bargap=0, legend_title_text=color)
+                    fig.update_xaxes(title_text=x_title, showgrid=True, gridcolor="LightGray")
+                    fig.update_yaxes(title_text=y_title, showgrid=True, gridcolor="LightGray")
                     fig.update_layout(title_text=chart_title, title_x=0.5)
 
-                    # put into html code
-                    plotly.offline.plot(fig, filename="Temp Plots" + os.path.sep + "hist_temp.html",
-                                        include_plotlyjs=True, auto_open=False)
-
-                    # add to pair plot tab
-                    self.hist_plot.load(
-                        QUrl.fromLocalFile(QFileInfo("Temp Plots" + os.path.sep + "hist_temp.html").absoluteFilePath()))
+                    # draw the chart, plotly.js is already loaded in the view
+                    self.hist_plot.show_figure(fig)
 
                 else:
                     msg = QMessageBox()
@@ -1586,18 +3914,35 @@ class Plot_Bot(QMainWindow):
                     else:
                         color_data = self.pp_color_disp.currentText()
 
-                    # build figure
-                    fig = px.scatter_matrix(self.data, dimensions=var, color=color_data, template="none")
+                    # build figure, large data is drawn as a density grid per pair with histograms down the diagonal
+                    mode = self.pp_render_disp.currentText()
+                    if mode == "Density" or (mode == "Auto" and len(self.data) > self.density_threshold):
+                        axes = {v: grid_axis(self.data[v], 100) for v in var}
+                        color_series = None if color_data is None else self.data[color_data]
+                        fig = make_subplots(rows=len(var), cols=len(var), horizontal_spacing=0.02, vertical_spacing=0.02)
+                        for row, y_var in enumerate(var):
+                            for col, x_var in enumerate(var):
+                                if row == col:
+                                    names, centers, widths, heights = histogram_bins(self.data[x_var], None, None, 50, "count", None)
+                                    fig.add_trace(go.Bar(x=centers, y=heights[0], width=widths, marker_color="Gray", showlegend=False,
+                                                         name=x_var), row=row + 1, col=col + 1)
+                                else:
+                                    x_edges, y_edges, z, z_title = density_grid(axes[x_var], axes[y_var], color_series)
+                                    fig.add_trace(go.Heatmap(x=x_edges, y=y_edges, z=z, coloraxis="coloraxis", hoverongaps=False,
+                                                             name="%s vs %s" % (y_var, x_var)), row=row + 1, col=col + 1)
+                                if row == len(var) - 1:
+                                    fig.update_xaxes(title_text=x_var, row=row + 1, col=col + 1)
+                                if col == 0:
+                                    fig.update_yaxes(title_text=y_var, row=row + 1, col=col + 1)
+                        fig.update_layout(template="none", bargap=0,
+                                          coloraxis=dict(colorscale="Viridis", colorbar_title_text=z_title))
+                    else:
+                        fig = px.scatter_matrix(self.data, dimensions=var, color=color_data, template="none")
 
                     fig.update_layout(title_text=chart_title, title_x=0.5)
 
-                    # put into html code
-                    plotly.offline.plot(fig, filename="Temp Plots" + os.path.sep + "pp_temp.html",
-                                        include_plotlyjs=True, auto_open=False)
-
-                    # add to pair plot tab
-                    self.pp_plot.load(
-                        QUrl.fromLocalFile(QFileInfo("Temp Plots" + os.path.sep + "pp_temp.html").absoluteFilePath()))
+                    # draw the chart, plotly.js is already loaded in the view
+                    self.pp_plot.show_figure(fig)
                 else:
                     msg = QMessageBox()
                     msg.setWindowTitle("Missing Variables")
@@ -1790,22 +4135,37 @@ class Plot_Bot(QMainWindow):
             if file == "":
                 return
             
-            # move current plot to file
+            # get the figure of the current plot
             if self.plot_panel.tabText(self.plot_panel.currentIndex()) == "&Time Series":
-                base_file = "ts_temp.html"
+                figure = self.ts_plot.figure
             elif self.plot_panel.tabText(self.plot_panel.currentIndex()) == "&X-Y":
-                base_file = "xy_temp.html"
+                figure = self.xy_plot.figure
             elif self.plot_panel.tabText(self.plot_panel.currentIndex()) == "&3D":
-                base_file = "3d_temp.html"
+                figure = self.three_dim_plot.figure
             elif self.plot_panel.tabText(self.plot_panel.currentIndex()) == "&Histogram":
-                base_file = "hist_temp.html"
+                figure = self.hist_plot.figure
             elif self.plot_panel.tabText(self.plot_panel.currentIndex()) == "&Pair Plot":
-                base_file = "pp_temp.html"
+                figure = self.pp_plot.figure
             else:
                 return
+            if figure is None:
+                return
 
-            # move
-            os.rename("Temp Plots" + os.path.sep + base_file, file)
+            # the time series on screen is decimated, the export is rebuilt with every point of each trace instead
+            if figure is self.ts_plot.figure and self.ts_decimated:
+                spec = figure.to_plotly_json()
+                for i, (t_var, y_var) in enumerate(self.ts_traces):
+                    if t_var in self.data.columns and y_var in self.data.columns:
+                        x, y = self.data[t_var].to_numpy(), self.data[y_var].to_numpy()
+                        webgl = use_webgl(self.ts_render_disp.currentText(), len(x), self.webgl_threshold)
+                        spec["data"][i].update(type="scattergl" if webgl else "scatter", x=x, y=y)
+                spec["layout"]["annotations"] = [note for note in spec["layout"].get("annotations", [])
+                                                 if not str(note.get("text", "")).startswith("Decimated to")]
+                figure = go.Figure(spec)
+                logging.info("Exported the time series with every point, the chart on screen is decimated")
+
+            # write a standalone copy with plotly.js included so it opens anywhere
+            plotly.offline.plot(figure, filename=file, include_plotlyjs=True, auto_open=False)
 
             # print message saying success
             msg = QMessageBox()
@@ -1831,6 +4191,8 @@ class Plot_Bot(QMainWindow):
         if u_app.data_changed:
             # copy over data
             self.data = u_app.data
+            # columns may have been overwritten under the same name, so cached bins no longer fit
+            self.hist_cache = None
             # reload needed items
             self.update_variable_holders()
 
@@ -1843,6 +4205,8 @@ class Plot_Bot(QMainWindow):
         if m_app.data_changed:
             # copy over data
             self.data = m_app.data
+            # columns may have been overwritten under the same name, so cached bins no longer fit
+            self.hist_cache = None
             # reload needed items
             self.update_variable_holders()
 
@@ -1865,7 +4229,7 @@ class Plot_Bot(QMainWindow):
         
         
 class File_Import_Settings(QDialog):
-    def __init__(self, folder="C:\\Data\\Plot_Bot\\File_Import"):
+    def __init__(self, folder="C:\\Data\\Plot_Bot\\File_Import", profile_loaded=False, files=None):
         QDialog.__init__(self)
 
         # create window
@@ -1882,13 +4246,47 @@ class File_Import_Settings(QDialog):
         self.data_start = 2
         self.delim = ","
         self.sheet = None
+        self.method = {}
+        self.profile_only = False
         self.loaded = False
+        self.files = list(files or [])
+
+        # look at the start of each file to see which methods fit them
+        self.sniffed = {}
+        for file in self.files:
+            try:
+                self.sniffed[file] = sniff_file(file)
+            except Exception:
+                logging.exception("Exception thrown while sniffing %s!" % file)
 
         # add list view of items in file import folder
         label = QLabel("File Import Method")
         self.l = QListWidget()
-        self.l.addItems(os.listdir(self.folder))
         self.l.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.list_methods()
+
+        # option to only parse the variables used by the loaded profile
+        self.profile_check = QCheckBox("Only load profile variables")
+        self.profile_check.setEnabled(profile_loaded)
+        self.profile_check.setToolTip("Other variables are loaded when they are used")
+
+        # option to merge the files by time instead of stacking them in file order
+        self.merge_check = QCheckBox("Merge files by time")
+        self.merge_check.setToolTip("For files that overlap in time or were copied, rows with the same timestamp are only kept once")
+
+        # optional window of the data to load, applied while the files are parsed
+        self.start_time_input = QLineEdit()
+        self.start_time_input.setPlaceholderText("Start time, e.g. 2024-01-01 13:00")
+        self.end_time_input = QLineEdit()
+        self.end_time_input.setPlaceholderText("End time")
+        self.first_row_input = QSpinBox()
+        self.first_row_input.setRange(1, 2**31 - 1)
+        self.first_row_input.setPrefix("First row ")
+        self.last_row_input = QSpinBox()
+        self.last_row_input.setRange(0, 2**31 - 1)
+        self.last_row_input.setPrefix("Last row ")
+        self.last_row_input.setSpecialValueText("Last row: end")
+        self.last_row_input.setToolTip("Rows are counted from the first data row of each file")
 
         # add load button - close when clicked
         b = QPushButton()
@@ -1907,8 +4305,14 @@ class File_Import_Settings(QDialog):
         # add widgets to layout
         layout.addWidget(label, 0, 0, 1, 2, Qt.AlignCenter)
         layout.addWidget(self.l, 1, 0, 2, 2)
-        layout.addWidget(b, 3, 0, 1, 1)
-        layout.addWidget(c, 3, 1, 1, 1)
+        layout.addWidget(self.profile_check, 3, 0, 1, 2)
+        layout.addWidget(self.merge_check, 4, 0, 1, 2)
+        layout.addWidget(self.start_time_input, 5, 0, 1, 1)
+        layout.addWidget(self.end_time_input, 5, 1, 1, 1)
+        layout.addWidget(self.first_row_input, 6, 0, 1, 1)
+        layout.addWidget(self.last_row_input, 6, 1, 1, 1)
+        layout.addWidget(b, 7, 0, 1, 1)
+        layout.addWidget(c, 7, 1, 1, 1)
 
         # show
         self.show()
@@ -1927,40 +4331,122 @@ class File_Import_Settings(QDialog):
             msg.exec()
             return
         else:
-            with open(self.folder + os.path.sep + self.l.currentItem().text(), "r") as file:
+            # check the time window before loading anything
+            window = [self.start_time_input.text().strip(), self.end_time_input.text().strip()]
+            try:
+                for t in window:
+                    if t:
+                        pd.Timestamp(t)
+            except ValueError:
+                msg = QMessageBox()
+                msg.setIcon(QMessageBox.Warning)
+                msg.setWindowTitle("Check Time Window")
+                msg.setText("Uh oh!")
+                msg.setInformativeText("The start and end times should look like 2024-01-01 13:00:00")
+                msg.setStandardButtons(QMessageBox.Ok)
+                msg.exec()
+                return
+
+            with open(self.folder + os.path.sep + self.l.currentItem().data(Qt.UserRole), "r") as file:
                 data = hjson.load(file)
 
-            # enumerate delimiter
-            delim_enum = {"Comma":",", "Semicolon":";", "Tab":"\t"}
+            # leave out files the method can't read before any parsing starts
+            rejected = [file for file in self.files if file in self.sniffed and method_match(data, self.sniffed[file]) is None]
+            if rejected:
+                msg = QMessageBox()
+                msg.setIcon(QMessageBox.Warning)
+                msg.setWindowTitle("Files Don't Match")
+                msg.setText("Uh oh!")
+                names = "\n".join(os.path.basename(file) for file in rejected[:10]) + ("\n..." if len(rejected) > 10 else "")
+                if len(rejected) == len(self.files):
+                    msg.setInformativeText("None of the files match this file import method:\n" + names)
+                    msg.setStandardButtons(QMessageBox.Ok)
+                    msg.exec()
+                    return
+                msg.setInformativeText("These files don't match this file import method:\n%s\n\nLoad the other files?" % names)
+                msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+                if msg.exec() != QMessageBox.Yes:
+                    return
+                self.files = [file for file in self.files if file not in rejected]
+
             # assign variables
             self.file_type = data["File_Type"].lower()
             self.header = data["Header_Row"]
             self.data_start = data["Data_Row"]
             if (self.file_type == "text"):
                 self.sheet = None
-                self.delim = delim_enum[data["Delimiter"]]
+                self.delim = DELIMITERS[data["Delimiter"]]
             elif (self.file_type == "spreadsheet"):
                 self.sheet = data["Sheet"]
                 self.delim = None
+            else:
+                self.sheet = None
+                self.delim = None
             self.datetime_format = data["Datetime_Format"]
 
+            # keep the raw method around for the file loaders, with the window to load
+            self.method = data
+            if any(window):
+                self.method["Time_Window"] = window
+            if self.first_row_input.value() > 1 or self.last_row_input.value() > 0:
+                self.method["Row_Window"] = [self.first_row_input.value(), self.last_row_input.value()]
+            if self.merge_check.isChecked():
+                self.method["Merge_By_Time"] = True
+            self.profile_only = self.profile_check.isChecked()
+
             self.loaded = True
                 
         # close out
         self.close()
 
+    def list_methods(self):
+        # list the file import methods, best fit for the selected files first
+        ranked = []
+        for name in os.listdir(self.folder):
+            matches = 0
+            score = 0
+            if self.sniffed:
+                try:
+                    with open(self.folder + os.path.sep + name, "r") as file:
+                        method = hjson.load(file)
+                    for sniffed in self.sniffed.values():
+                        match = method_match(method, sniffed)
+                        if match is not None:
+                            matches += 1
+                            score += match
+                except Exception:
+                    logging.exception("Exception thrown while reading %s!" % name)
+            ranked.append((-matches, -score, name))
+        ranked.sort()
+
+        self.l.clear()
+        for matches, _, name in ranked:
+            item = QListWidgetItem(name)
+            item.setData(Qt.UserRole, name)
+            if self.sniffed:
+                if -matches == len(self.sniffed):
+                    item.setText("%s (fits all files)" % name)
+                elif matches == 0:
+                    item.setText("%s (fits no files)" % name)
+                    item.setForeground(Qt.gray)
+                else:
+                    item.setText("%s (fits %d of %d files)" % (name, -matches, len(self.sniffed)))
+            self.l.addItem(item)
+        if self.sniffed and ranked and ranked[0][0] < 0:
+            self.l.setCurrentRow(0)
+
     def create_prof(self):
-        # ask user for method details
-        d = Create_File_Import_Method(self.folder)
+        # ask user for method details, starting from the layout of the first file
+        sniffed = self.sniffed.get(self.files[0], None) if self.files else None
+        d = Create_File_Import_Method(self.folder, sniffed)
         d.exec()
 
         if d.saved:
             # update list view
-            self.l.clear()
-            self.l.addItems(os.listdir(self.folder))
+            self.list_methods()
 
 class Create_File_Import_Method(QDialog):
-    def __init__(self, folder):
+    def __init__(self, folder, sniffed=None):
         QDialog.__init__(self)
 
         # create a window
@@ -1978,6 +4464,7 @@ class Create_File_Import_Method(QDialog):
         self.file_type = QComboBox()
         self.file_type.addItem("Text")
         self.file_type.addItem("Spreadsheet")
+        self.file_type.addItem("Binary")
         self.header_input = QSpinBox()
         self.header_input.setMinimum(1)
         self.header_input.valueChanged.connect(self.header_changed)
@@ -1987,11 +4474,52 @@ class Create_File_Import_Method(QDialog):
         self.delimiter_input = QComboBox()
         self.delimiter_input.addItems(["Comma", "Semicolon", "Tab"])
         self.sheet_input = QLineEdit()
+        self.sheet_input.setPlaceholderText("First sheet")
+        self.sheet_input.setToolTip("Sheet name, several sheet names separated by commas, or * for every sheet")
         self.datetime_input = QComboBox()
         self.datetime_input.addItems(["ISO", "Unix Epoch"])
+        self.epoch_unit_input = QComboBox()
+        self.epoch_unit_input.addItems(EPOCH_UNITS.keys())
+        self.datetime_columns_input = QLineEdit()
+        self.datetime_columns_input.setPlaceholderText("First column")
+        self.datetime_pattern_input = QLineEdit()
+        self.datetime_pattern_input.setPlaceholderText("%Y-%m-%d %H:%M:%S.%f")
+        self.import_mode_input = QComboBox()
+        self.import_mode_input.addItems(["Standard", "Streaming"])
+        self.parser_input = QComboBox()
+        self.parser_input.addItems(PARSERS)
+        self.parser_input.setToolTip("C handles every file, PyArrow parses on several threads, NumPy is for files that are only numbers. "
+                                     "Files the PyArrow and NumPy parsers can't read fall back on the C parser")
+        self.chunk_size_input = QSpinBox()
+        self.chunk_size_input.setRange(1000, 10000000)
+        self.chunk_size_input.setSingleStep(10000)
+        self.chunk_size_input.setValue(100000)
+        self.precision_input = QComboBox()
+        self.precision_input.addItems(["Full", "Auto", "Single"])
+        self.precision_input.setToolTip("Full keeps dtypes as parsed, Auto shrinks dtypes where the rounding stays within the tolerance of each column's range "
+                                        "and under half its smallest step, "
+                                        "Single also stores every float in single precision")
+        self.tolerance_input = QLineEdit("1e-6")
+        self.header_length_input = QSpinBox()
+        self.header_length_input.setRange(0, 2**31 - 1)
+        self.header_length_input.setToolTip("Bytes before the first record of a binary file")
+        self.record_layout_input = QLineEdit()
+        self.record_layout_input.setPlaceholderText("Time:f8, Speed:f4, Gear:u1")
+        self.record_layout_input.setToolTip("Name and numpy dtype of each field of a binary record, in order")
+        self.endianness_input = QComboBox()
+        self.endianness_input.addItems(["Little", "Big"])
         self.save_button = QPushButton("Save")
         self.save_button.clicked.connect(self.save)
 
+        # fill in what was sniffed from the selected files
+        if sniffed is not None:
+            self.file_type.setCurrentText(sniffed["File_Type"])
+            if "Delimiter" in sniffed:
+                self.delimiter_input.setCurrentText(sniffed["Delimiter"])
+                self.data_input.setValue(sniffed["Data_Row"])
+                self.header_input.setValue(sniffed["Header_Row"])
+                self.datetime_input.setCurrentText(sniffed["Datetime_Format"])
+
         # set layout and add items
         self.setLayout(QGridLayout())
         self.layout().addWidget(QLabel("Method Name"), 0, 0, 1, 1, Qt.AlignRight)
@@ -2008,7 +4536,29 @@ class Create_File_Import_Method(QDialog):
         self.layout().addWidget(self.sheet_input, 2, 3, 1, 1)
         self.layout().addWidget(QLabel("Datetime Format"), 3, 0, 1, 1, Qt.AlignRight)
         self.layout().addWidget(self.datetime_input, 3, 1, 1, 1)
-        self.layout().addWidget(self.save_button, 3, 3, 1, 1)
+        self.layout().addWidget(QLabel("Epoch Unit"), 3, 2, 1, 1, Qt.AlignRight)
+        self.layout().addWidget(self.epoch_unit_input, 3, 3, 1, 1)
+        self.layout().addWidget(QLabel("Datetime Columns"), 4, 0, 1, 1, Qt.AlignRight)
+        self.layout().addWidget(self.datetime_columns_input, 4, 1, 1, 1)
+        self.layout().addWidget(QLabel("Datetime Pattern"), 4, 2, 1, 1, Qt.AlignRight)
+        self.layout().addWidget(self.datetime_pattern_input, 4, 3, 1, 1)
+        self.layout().addWidget(QLabel("Import Mode"), 5, 0, 1, 1, Qt.AlignRight)
+        self.layout().addWidget(self.import_mode_input, 5, 1, 1, 1)
+        self.layout().addWidget(QLabel("Chunk Rows"), 5, 2, 1, 1, Qt.AlignRight)
+        self.layout().addWidget(self.chunk_size_input, 5, 3, 1, 1)
+        self.layout().addWidget(QLabel("Precision"), 6, 0, 1, 1, Qt.AlignRight)
+        self.layout().addWidget(self.precision_input, 6, 1, 1, 1)
+        self.layout().addWidget(QLabel("Tolerance"), 6, 2, 1, 1, Qt.AlignRight)
+        self.layout().addWidget(self.tolerance_input, 6, 3, 1, 1)
+        self.layout().addWidget(QLabel("Parser"), 7, 0, 1, 1, Qt.AlignRight)
+        self.layout().addWidget(self.parser_input, 7, 1, 1, 1)
+        self.layout().addWidget(QLabel("Header Bytes"), 8, 0, 1, 1, Qt.AlignRight)
+        self.layout().addWidget(self.header_length_input, 8, 1, 1, 1)
+        self.layout().addWidget(QLabel("Endianness"), 8, 2, 1, 1, Qt.AlignRight)
+        self.layout().addWidget(self.endianness_input, 8, 3, 1, 1)
+        self.layout().addWidget(QLabel("Record Layout"), 9, 0, 1, 1, Qt.AlignRight)
+        self.layout().addWidget(self.record_layout_input, 9, 1, 1, 3)
+        self.layout().addWidget(self.save_button, 10, 3, 1, 1)
 
         self.show()
 
@@ -2021,13 +4571,51 @@ class Create_File_Import_Method(QDialog):
             self.header_input.setValue(self.data_input.value() - 1)
 
     def save(self):
+        # binary files need a record layout numpy understands
+        if self.file_type.currentText() == "Binary":
+            try:
+                binary_dtype({"Record_Layout": self.record_layout_input.text()})
+            except Exception:
+                msg = QMessageBox()
+                msg.setWindowTitle("Check Record Layout")
+                msg.setIcon(QMessageBox.Critical)
+                msg.setText("Uh oh!")
+                msg.setInformativeText("The record layout should list name:dtype pairs, like Time:f8, Speed:f4, Gear:u1")
+                msg.exec()
+                return
+
+        # the tolerance has to be a positive number
+        try:
+            tolerance = float(self.tolerance_input.text())
+            if not tolerance > 0 or math.isinf(tolerance):
+                raise ValueError(self.tolerance_input.text())
+        except ValueError:
+            msg = QMessageBox()
+            msg.setWindowTitle("Check Tolerance")
+            msg.setIcon(QMessageBox.Critical)
+            msg.setText("Uh oh!")
+            msg.setInformativeText("The tolerance should be a positive number, like 1e-6")
+            msg.exec()
+            return
+
         # create dictionary with items
         d = {"File_Type": self.file_type.currentText(),
          "Header_Row":self.header_input.value(),
          "Data_Row":self.data_input.value(),
          "Delimiter":self.delimiter_input.currentText(),
          "Sheet":self.sheet_input.text(),
-         "Datetime_Format":self.datetime_input.currentText()}
+         "Datetime_Format":self.datetime_input.currentText(),
+         "Epoch_Unit":self.epoch_unit_input.currentText(),
+         "Datetime_Columns":[col.strip() for col in self.datetime_columns_input.text().split(",") if col.strip() != ""],
+         "Datetime_Pattern":self.datetime_pattern_input.text(),
+         "Import_Mode":self.import_mode_input.currentText(),
+         "Parser":self.parser_input.currentText(),
+         "Header_Length":self.header_length_input.value(),
+         "Record_Layout":self.record_layout_input.text(),
+         "Endianness":self.endianness_input.currentText(),
+         "Chunk_Size":self.chunk_size_input.value(),
+         "Precision":self.precision_input.currentText(),
+         "Precision_Tolerance":tolerance}
         with open(self.folder + os.path.sep + self.name.text() + ".fim", "w") as file:
             hjson.dump(d, file)
 
@@ -2293,6 +4881,9 @@ class Add_Math_Channel(QDialog):
 
 if __name__ == '__main__':
 
+    # workbooks are parsed in worker processes, which need this in a frozen app
+    multiprocessing.freeze_support()
+
     # create application container
     app = QApplication([])
     app.setStyle("Fusion")